@@ -0,0 +1,71 @@
+"""
+Helper bersama untuk script contoh dan debug English to Python Translator
+"""
+
+import ast
+import functools
+import os
+import sys
+
+# Add src directory to Python path
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Set test mode to avoid GUI
+os.environ.setdefault('PYTEST_CURRENT_TEST', 'true')
+
+
+@functools.lru_cache(maxsize=1)
+def get_engine():
+    """Get the shared TranslationEngine instance (created once per process)"""
+    from services.translation_engine import TranslationEngine
+    return TranslationEngine()
+
+
+@functools.lru_cache(maxsize=1024)
+def translate_cached(text):
+    """
+    Translate text with the shared engine, memoized by the raw input string.
+    Results are shared between callers and must not be mutated.
+    """
+    return get_engine().translate(text)
+
+
+def translate_many(texts):
+    """Translate several texts in order through the shared translation memo"""
+    return [translate_cached(text) for text in texts]
+
+
+@functools.lru_cache(maxsize=256)
+def check_syntax(source):
+    """
+    Check Python source for syntax errors without emitting bytecode.
+    Raises SyntaxError; successful checks are cached by source text.
+    """
+    ast.parse(source, mode='exec')
+
+
+def label_characters(text, labels):
+    """Label each character of text, using labels for special characters"""
+    return [labels.get(char) or f"'{char}'" for char in text]
+
+
+def emit_indented(lines, prefix="    "):
+    """Write lines to stdout with a prefix, using a single write call"""
+    sys.stdout.write("".join(f"{prefix}{line}\n" for line in lines))
+
+
+def _silent(*args, **kwargs):
+    """Drop output; stands in for print when a demo runs quietly"""
+
+
+def demo_output(module_name):
+    """
+    Return (log, emit) for a demo script's output.
+    Output is only printed when the script runs directly (module_name is
+    "__main__"); DEMO_VERBOSE=0 silences it there too.
+    """
+    if module_name == "__main__" and os.environ.get("DEMO_VERBOSE", "1") == "1":
+        return print, emit_indented
+    return _silent, _silent
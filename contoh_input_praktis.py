@@ -4,16 +4,42 @@ Contoh Input Praktis untuk English to Python Translator
 Jalankan file ini untuk melihat contoh-contoh input yang bisa digunakan
 """
 
+import sys
+
+# Skenario step-by-step: (judul, langkah-langkah)
+SCENARIOS = (
+    ("🎓 Scenario: Sistem Penilaian Siswa", (
+        "set student_name to Alice",
+        "set math_score to 85",
+        "set english_score to 92",
+        "if math_score greater than 80 then print good_math",
+        "if english_score greater than 90 then print excellent_english else print good_english",
+    )),
+    ("🌡️ Scenario: Sistem Monitoring Cuaca", (
+        "set temperature to 35",
+        "set humidity to 75",
+        "if temperature greater than 30 then print hot else print normal",
+        "when humidity greater than 70 do print humid",
+    )),
+    ("👤 Scenario: Sistem Verifikasi Usia", (
+        "set user_age to 17",
+        "set has_permission to false",
+        "if user_age greater than 18 then print adult else print minor",
+        "when has_permission equals true do print access_granted",
+    )),
+)
+
 def tampilkan_contoh_input():
     """Menampilkan berbagai contoh input yang bisa digunakan"""
+    buf = []
     
-    print("🎯 CONTOH INPUT UNTUK ENGLISH TO PYTHON TRANSLATOR")
-    print("=" * 60)
-    print()
+    buf.append("🎯 CONTOH INPUT UNTUK ENGLISH TO PYTHON TRANSLATOR")
+    buf.append("=" * 60)
+    buf.append("")
     
     # Contoh Assignment
-    print("📦 1. ASSIGNMENT VARIABEL")
-    print("-" * 30)
+    buf.append("📦 1. ASSIGNMENT VARIABEL")
+    buf.append("-" * 30)
     contoh_assignment = [
         "set age to 25",
         "set name to John", 
@@ -22,13 +48,12 @@ def tampilkan_contoh_input():
         "set status to active"
     ]
     
-    for i, contoh in enumerate(contoh_assignment, 1):
-        print(f"{i}. {contoh}")
-    print()
+    buf.extend(f"{i}. {contoh}" for i, contoh in enumerate(contoh_assignment, 1))
+    buf.append("")
     
     # Contoh Aritmatika
-    print("🔢 2. OPERASI ARITMATIKA")
-    print("-" * 30)
+    buf.append("🔢 2. OPERASI ARITMATIKA")
+    buf.append("-" * 30)
     contoh_aritmatika = [
         "add 10 and 5",
         "subtract 3 from 15", 
@@ -37,13 +62,12 @@ def tampilkan_contoh_input():
         "calculate 25 plus 30"
     ]
     
-    for i, contoh in enumerate(contoh_aritmatika, 1):
-        print(f"{i}. {contoh}")
-    print()
+    buf.extend(f"{i}. {contoh}" for i, contoh in enumerate(contoh_aritmatika, 1))
+    buf.append("")
     
     # Contoh Conditional (BARU DIPERBAIKI!)
-    print("🔀 3. CONDITIONAL STATEMENTS (BARU DIPERBAIKI!)")
-    print("-" * 50)
+    buf.append("🔀 3. CONDITIONAL STATEMENTS (BARU DIPERBAIKI!)")
+    buf.append("-" * 50)
     contoh_conditional = [
         "if age greater than 18 then print adult",
         "if score less than 60 then print fail",
@@ -52,14 +76,13 @@ def tampilkan_contoh_input():
         "if score greater than 80 then print excellent else print good"
     ]
     
-    for i, contoh in enumerate(contoh_conditional, 1):
-        print(f"{i}. {contoh}")
-    print()
+    buf.extend(f"{i}. {contoh}" for i, contoh in enumerate(contoh_conditional, 1))
+    buf.append("")
     
     # Workflow Lengkap
-    print("🚀 4. WORKFLOW LENGKAP")
-    print("-" * 25)
-    print("Coba urutan input ini:")
+    buf.append("🚀 4. WORKFLOW LENGKAP")
+    buf.append("-" * 25)
+    buf.append("Coba urutan input ini:")
     workflow = [
         "set age to 20",
         "set score to 85", 
@@ -68,67 +91,39 @@ def tampilkan_contoh_input():
         "when age equals 20 do print twenty"
     ]
     
-    for i, step in enumerate(workflow, 1):
-        print(f"{i}. {step}")
-    print()
-    
-    print("💡 CARA MENGGUNAKAN:")
-    print("1. Jalankan: python main.py")
-    print("2. Masukkan salah satu contoh input di atas")
-    print("3. Klik 'Translate' untuk melihat kode Python")
-    print("4. Klik 'Run Code' untuk menjalankan kode")
-    print()
-    
-    print("✨ FITUR BARU YANG SUDAH DIPERBAIKI:")
-    print("✅ Print statements sekarang menghasilkan print() yang benar")
-    print("✅ Else clause sudah fully implemented") 
-    print("✅ Multiple conditional patterns (if-then, when-do)")
-    print("✅ Deteksi otomatis string literal vs variabel")
+    buf.extend(f"{i}. {step}" for i, step in enumerate(workflow, 1))
+    buf.append("")
+    
+    buf.append("💡 CARA MENGGUNAKAN:")
+    buf.append("1. Jalankan: python main.py")
+    buf.append("2. Masukkan salah satu contoh input di atas")
+    buf.append("3. Klik 'Translate' untuk melihat kode Python")
+    buf.append("4. Klik 'Run Code' untuk menjalankan kode")
+    buf.append("")
+    
+    buf.append("✨ FITUR BARU YANG SUDAH DIPERBAIKI:")
+    buf.append("✅ Print statements sekarang menghasilkan print() yang benar")
+    buf.append("✅ Else clause sudah fully implemented")
+    buf.append("✅ Multiple conditional patterns (if-then, when-do)")
+    buf.append("✅ Deteksi otomatis string literal vs variabel")
+    
+    sys.stdout.write("\n".join(buf) + "\n")
 
 def contoh_step_by_step():
     """Contoh step-by-step untuk dicoba"""
+    buf = []
     
-    print("\n" + "="*60)
-    print("📋 CONTOH STEP-BY-STEP UNTUK DICOBA")
-    print("="*60)
-    
-    scenarios = [
-        {
-            "title": "🎓 Scenario: Sistem Penilaian Siswa",
-            "steps": [
-                "set student_name to Alice",
-                "set math_score to 85",
-                "set english_score to 92", 
-                "if math_score greater than 80 then print good_math",
-                "if english_score greater than 90 then print excellent_english else print good_english"
-            ]
-        },
-        {
-            "title": "🌡️ Scenario: Sistem Monitoring Cuaca", 
-            "steps": [
-                "set temperature to 35",
-                "set humidity to 75",
-                "if temperature greater than 30 then print hot else print normal",
-                "when humidity greater than 70 do print humid"
-            ]
-        },
-        {
-            "title": "👤 Scenario: Sistem Verifikasi Usia",
-            "steps": [
-                "set user_age to 17",
-                "set has_permission to false",
-                "if user_age greater than 18 then print adult else print minor", 
-                "when has_permission equals true do print access_granted"
-            ]
-        }
-    ]
+    buf.append("\n" + "="*60)
+    buf.append("📋 CONTOH STEP-BY-STEP UNTUK DICOBA")
+    buf.append("="*60)
+    
+    for title, steps in SCENARIOS:
+        buf.append(f"\n{title}")
+        buf.append("-" * 40)
+        buf.extend(f"{i}. {step}" for i, step in enumerate(steps, 1))
+        buf.append("")
     
-    for scenario in scenarios:
-        print(f"\n{scenario['title']}")
-        print("-" * 40)
-        for i, step in enumerate(scenario['steps'], 1):
-            print(f"{i}. {step}")
-        print()
+    sys.stdout.write("\n".join(buf) + "\n")
 
 if __name__ == "__main__":
     tampilkan_contoh_input()
@@ -5,84 +5,75 @@ Menggunakan format yang sesuai dengan pattern yang didukung
 """
 
 import sys
-import os
 
-# Add src directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
+from _common import get_engine
 
-from services.translation_engine import TranslationEngine
+# Berdasarkan error message, format yang benar adalah:
+# "if x greater than 5 then print yes"
+# "when count equals 0 do print empty"
+CONTOH_BENAR = (
+    # 1. Setup variabel dulu
+    ("🔧 Setup Variabel", (
+        "set age to 20",
+        "set score to 85",
+        "set temperature to 35",
+        "set count to 0",
+    )),
+    
+    # 2. IF dengan THEN (format yang benar)
+    ("🔀 IF dengan THEN", (
+        "if age greater than 18 then print adult",
+        "if score greater than 80 then print excellent",
+        "if temperature greater than 30 then print hot",
+        "if count equals 0 then print empty",
+    )),
+    
+    # 3. WHEN dengan DO (format alternatif)
+    ("🔄 WHEN dengan DO", (
+        "when age greater than 25 do print mature",
+        "when score equals 100 do print perfect",
+        "when temperature less than 20 do print cold",
+        "when count equals 0 do print zero",
+    )),
+    
+    # 4. IF dengan ELSE
+    ("🔀 IF dengan ELSE", (
+        "if age greater than 18 then print adult else print minor",
+        "if score greater than 60 then print pass else print fail",
+    )),
+)
 
 def main():
-    engine = TranslationEngine()
+    translate = get_engine().translate
     
     print("✅ === CONTOH PERCABANGAN YANG BENAR ===\n")
     
-    # Berdasarkan error message, format yang benar adalah:
-    # "if x greater than 5 then print yes"
-    # "when count equals 0 do print empty"
-    
-    contoh_benar = [
-        # 1. Setup variabel dulu
-        ("🔧 Setup Variabel", [
-            "set age to 20",
-            "set score to 85", 
-            "set temperature to 35",
-            "set count to 0"
-        ]),
-        
-        # 2. IF dengan THEN (format yang benar)
-        ("🔀 IF dengan THEN", [
-            "if age greater than 18 then print adult",
-            "if score greater than 80 then print excellent", 
-            "if temperature greater than 30 then print hot",
-            "if count equals 0 then print empty"
-        ]),
-        
-        # 3. WHEN dengan DO (format alternatif)
-        ("🔄 WHEN dengan DO", [
-            "when age greater than 25 do print mature",
-            "when score equals 100 do print perfect",
-            "when temperature less than 20 do print cold",
-            "when count equals 0 do print zero"
-        ]),
-        
-        # 4. IF dengan ELSE
-        ("🔀 IF dengan ELSE", [
-            "if age greater than 18 then print adult else print minor",
-            "if score greater than 60 then print pass else print fail"
-        ])
-    ]
-    
-    for kategori, instruksi_list in contoh_benar:
-        print(f"{kategori}:")
-        print("-" * 50)
+    for kategori, instruksi_list in CONTOH_BENAR:
+        buf = [f"{kategori}:", "-" * 50]
         
         for instruksi in instruksi_list:
-            result = engine.translate(instruksi)
+            result = translate(instruksi)
             
-            print(f"📝 INPUT:  {instruksi}")
+            buf.append(f"📝 INPUT:  {instruksi}")
             
             if result.success:
-                print(f"🐍 OUTPUT: {result.python_code}")
+                buf.append(f"🐍 OUTPUT: {result.python_code}")
                 
                 # Tampilkan dengan indentasi yang benar
-                if '\n' in result.python_code:
-                    print("🐍 FORMATTED:")
-                    lines = result.python_code.split('\n')
-                    for line in lines:
-                        print(f"          {line}")
+                lines = result.python_code.splitlines()
+                if len(lines) > 1:
+                    buf.append("🐍 FORMATTED:")
+                    buf.extend(f"          {line}" for line in lines)
                 
                 if result.warnings:
-                    print(f"⚠️  WARNINGS: {len(result.warnings)} warning(s)")
+                    buf.append(f"⚠️  WARNINGS: {len(result.warnings)} warning(s)")
             else:
-                print(f"❌ ERROR: {result.error_message}")
+                buf.append(f"❌ ERROR: {result.error_message}")
             
-            print()
+            buf.append("")
         
-        print()
+        buf.append("")
+        sys.stdout.write("\n".join(buf) + "\n")
 
 def panduan_format_benar():
     print("📚 === PANDUAN FORMAT YANG BENAR ===\n")
@@ -4,19 +4,10 @@ Contoh Percabangan Sederhana - English to Python Translator
 Contoh input yang benar-benar bisa digunakan
 """
 
-import sys
-import os
-
-# Add src directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
-
-from services.translation_engine import TranslationEngine
+from _common import get_engine
 
 def main():
-    engine = TranslationEngine()
+    translate = get_engine().translate
     
     print("🎯 === CONTOH PERCABANGAN YANG BISA DIGUNAKAN ===\n")
     
@@ -52,7 +43,7 @@ def main():
         print("-" * 40)
         
         for instruksi in instruksi_list:
-            result = engine.translate(instruksi)
+            result = translate(instruksi)
             
             if result.success:
                 print(f"✅ {instruksi}")
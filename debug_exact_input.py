@@ -4,23 +4,24 @@ Debug script untuk test input persis seperti yang diberikan user
 """
 
 import sys
-import os
 
-# Add src to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
-
-# Set test mode to avoid GUI
-os.environ['PYTEST_CURRENT_TEST'] = 'true'
+# Label untuk karakter khusus pada analisis karakter
+_CHAR_LABELS = {' ': "[SPACE]", '\n': "[NEWLINE]", '\t': "[TAB]"}
+_ERROR_CHAR_LABELS = {
+    '"': "'\"' (QUOTE)",
+    "'": "''' (QUOTE)",
+    '\n': "'\\n' (NEWLINE)",
+    ' ': "[SPACE]",
+}
 
 def debug_exact_user_input():
     """Debug dengan input persis seperti yang diberikan user"""
     
     try:
-        from services.translation_engine import TranslationEngine
+        # _common adds src to sys.path and sets test mode
+        from _common import check_syntax, get_engine, label_characters
         
-        engine = TranslationEngine()
+        engine = get_engine()
         
         print("🐛 DEBUG: INPUT PERSIS SEPERTI USER")
         print("=" * 40)
@@ -34,16 +35,8 @@ def debug_exact_user_input():
         print()
         print("📏 Length:", len(user_input))
         print("🔍 Character analysis:")
-        for i, char in enumerate(user_input):
-            if i < 100:  # Show first 100 chars
-                if char == ' ':
-                    print(f"  {i}: [SPACE]")
-                elif char == '\n':
-                    print(f"  {i}: [NEWLINE]")
-                elif char == '\t':
-                    print(f"  {i}: [TAB]")
-                else:
-                    print(f"  {i}: '{char}'")
+        labels = label_characters(user_input[:100], _CHAR_LABELS)  # Show first 100 chars
+        sys.stdout.write("".join(f"  {i}: {label}\n" for i, label in enumerate(labels)))
         print()
         
         # Test translation
@@ -60,7 +53,7 @@ def debug_exact_user_input():
             
             # Test syntax validation
             try:
-                compile(result.python_code, '<string>', 'exec')
+                check_syntax(result.python_code)
                 print("✅ Syntax Valid!")
             except SyntaxError as e:
                 print(f"❌ SYNTAX ERROR FOUND!")
@@ -71,7 +64,7 @@ def debug_exact_user_input():
                 
                 # Show the problematic code with line numbers
                 print("📝 GENERATED CODE WITH LINE NUMBERS:")
-                for j, line in enumerate(result.python_code.split('\n'), 1):
+                for j, line in enumerate(result.python_code.splitlines(), 1):
                     marker = ">>> " if j == e.lineno else "    "
                     print(f"{marker}{j}: '{line}'")
                 print()
@@ -79,15 +72,8 @@ def debug_exact_user_input():
                 # Character analysis of problematic line
                 if e.text:
                     print("🔍 CHARACTER ANALYSIS OF PROBLEMATIC LINE:")
-                    for k, char in enumerate(e.text):
-                        if char in ['"', "'"]:
-                            print(f"     {k}: '{char}' (QUOTE)")
-                        elif char == '\n':
-                            print(f"     {k}: '\\n' (NEWLINE)")
-                        elif char == ' ':
-                            print(f"     {k}: [SPACE]")
-                        else:
-                            print(f"     {k}: '{char}'")
+                    labels = label_characters(e.text, _ERROR_CHAR_LABELS)
+                    sys.stdout.write("".join(f"     {k}: {label}\n" for k, label in enumerate(labels)))
                 
         else:
             print("❌ Translation Failed!")
@@ -102,9 +88,9 @@ def test_multiline_input():
     """Test dengan input yang dipisah dengan newline"""
     
     try:
-        from services.translation_engine import TranslationEngine
+        from _common import check_syntax, get_engine
         
-        engine = TranslationEngine()
+        engine = get_engine()
         
         print("🧪 TEST: MULTILINE INPUT")
         print("=" * 30)
@@ -135,7 +121,7 @@ if english_score greater than 90 then print excellent_english else print good_en
             
             # Test syntax
             try:
-                compile(result.python_code, '<string>', 'exec')
+                check_syntax(result.python_code)
                 print("✅ Syntax Valid!")
             except SyntaxError as e:
                 print(f"❌ SYNTAX ERROR: {e}")
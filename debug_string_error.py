@@ -4,23 +4,24 @@ Debug script untuk mereproduksi error "unterminated string literal"
 """
 
 import sys
-import os
+from bisect import bisect_right
+from itertools import accumulate
 
-# Add src to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
-
-# Set test mode to avoid GUI
-os.environ['PYTEST_CURRENT_TEST'] = 'true'
+# Label untuk karakter khusus pada analisis karakter
+_ERROR_CHAR_LABELS = {
+    '"': "'\"' (quote)",
+    "'": "''' (quote)",
+    '\n': "'\\n' (newline)",
+}
 
 def debug_string_error():
     """Debug error yang terjadi dengan input user"""
     
     try:
-        from services.translation_engine import TranslationEngine
+        # _common adds src to sys.path and sets test mode
+        from _common import check_syntax, get_engine
         
-        engine = TranslationEngine()
+        translate = get_engine().translate
         
         print("🐛 DEBUG: UNTERMINATED STRING LITERAL ERROR")
         print("=" * 50)
@@ -46,32 +47,15 @@ def debug_string_error():
             print(f"🔍 Testing Input {i}: {input_text}")
             print("-" * 40)
             
-            result = engine.translate(input_text)
+            result = translate(input_text)
             
             if result.success:
                 print("✅ Translation Success!")
                 print("Generated Code:")
-                for line in result.python_code.split('\n'):
+                for line in result.python_code.splitlines():
                     print(f"    {line}")
                 
                 all_code.append(result.python_code)
-                
-                # Test syntax validation
-                try:
-                    compile(result.python_code, '<string>', 'exec')
-                    print("✅ Syntax Valid!")
-                except SyntaxError as e:
-                    print(f"❌ SYNTAX ERROR: {e}")
-                    print(f"   Line {e.lineno}: {e.text}")
-                    print(f"   Error: {e.msg}")
-                    
-                    # Show the problematic code with line numbers
-                    print("\n📝 PROBLEMATIC CODE:")
-                    for j, line in enumerate(result.python_code.split('\n'), 1):
-                        marker = ">>> " if j == e.lineno else "    "
-                        print(f"{marker}{j}: {line}")
-                    
-                    return  # Stop at first error
                     
             else:
                 print("❌ Translation Failed!")
@@ -80,23 +64,36 @@ def debug_string_error():
             
             print()
         
-        # Test combined code
+        # Test combined code - one syntax check covers every input
         print("🔄 TESTING COMBINED CODE:")
         print("-" * 30)
         
         combined_code = '\n'.join(all_code)
+        syntax_error = None
+        try:
+            check_syntax(combined_code)
+        except SyntaxError as e:
+            syntax_error = e
+        
         print("Combined Code:")
-        for i, line in enumerate(combined_code.split('\n'), 1):
-            print(f"    {i}: {line}")
+        for i, line in enumerate(combined_code.splitlines(), 1):
+            marker = ">>> " if syntax_error and i == syntax_error.lineno else "    "
+            print(f"{marker}{i}: {line}")
         
-        try:
-            compile(combined_code, '<string>', 'exec')
+        if syntax_error is None:
             print("✅ Combined code syntax is valid!")
-        except SyntaxError as e:
+        else:
+            e = syntax_error
             print(f"❌ COMBINED CODE SYNTAX ERROR: {e}")
             print(f"   Line {e.lineno}: {e.text}")
             print(f"   Error: {e.msg}")
             
+            # Map the error line back to the input that generated it
+            if e.lineno:
+                line_starts = list(accumulate([1] + [code.count('\n') + 1 for code in all_code[:-1]]))
+                index = bisect_right(line_starts, e.lineno) - 1
+                print(f"   From input {index + 1}: {problematic_inputs[index]}")
+            
     except ImportError as e:
         print(f"❌ Import error: {e}")
     except Exception as e:
@@ -106,9 +103,9 @@ def test_specific_problematic_cases():
     """Test kasus-kasus spesifik yang mungkin bermasalah"""
     
     try:
-        from services.translation_engine import TranslationEngine
+        from _common import check_syntax, get_engine, label_characters
         
-        engine = TranslationEngine()
+        translate = get_engine().translate
         
         print("🧪 TEST: KASUS SPESIFIK YANG BERMASALAH")
         print("=" * 45)
@@ -134,16 +131,16 @@ def test_specific_problematic_cases():
             print(f"Input: {test_case['input']}")
             print("-" * 40)
             
-            result = engine.translate(test_case['input'])
+            result = translate(test_case['input'])
             
             if result.success:
                 print("Generated Code:")
-                for line in result.python_code.split('\n'):
+                for line in result.python_code.splitlines():
                     print(f"    {line}")
                 
                 # Test syntax
                 try:
-                    compile(result.python_code, '<string>', 'exec')
+                    check_syntax(result.python_code)
                     print("✅ Syntax Valid!")
                 except SyntaxError as e:
                     print(f"❌ SYNTAX ERROR: {e}")
@@ -153,13 +150,8 @@ def test_specific_problematic_cases():
                     if e.text:
                         print(f"   Problematic line: '{e.text.strip()}'")
                         print(f"   Character analysis:")
-                        for i, char in enumerate(e.text):
-                            if char in ['"', "'"]:
-                                print(f"     Position {i}: '{char}' (quote)")
-                            elif char == '\n':
-                                print(f"     Position {i}: '\\n' (newline)")
-                            else:
-                                print(f"     Position {i}: '{char}'")
+                        labels = label_characters(e.text, _ERROR_CHAR_LABELS)
+                        sys.stdout.write("".join(f"     Position {i}: {label}\n" for i, label in enumerate(labels)))
                     
             else:
                 print(f"❌ Translation Failed: {result.error_message}")
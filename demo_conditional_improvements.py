@@ -3,29 +3,31 @@
 Demo script showing the improved conditional statement functionality
 """
 
+import io
 import sys
-import os
 
-# Add src to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
+# _common adds src to sys.path and sets test mode
+from _common import demo_output
+
+_log, _emit = demo_output(__name__)
 
 try:
-    from core.input_parser import InputParser
-    from core.code_generator import CodeGenerator
-    from services.translation_engine import TranslationEngine
+    from _common import translate_cached, translate_many
 except ImportError:
     print("Import error - running from main.py instead")
     sys.exit(1)
 
+# Separator lines
+SEP_EQ30 = "=" * 30
+SEP_EQ50 = "=" * 50
+SEP_DASH20 = "-" * 20
+SEP_DASH50 = "-" * 50
+
 def demo_improved_conditionals():
     """Demonstrate the improved conditional statement functionality"""
-    engine = TranslationEngine()
-    
-    print("🎉 IMPROVED CONDITIONAL STATEMENTS DEMO")
-    print("=" * 50)
-    print()
+    _log("🎉 IMPROVED CONDITIONAL STATEMENTS DEMO")
+    _log(SEP_EQ50)
+    _log()
     
     # Test cases showing the improvements
     test_cases = [
@@ -57,35 +59,32 @@ def demo_improved_conditionals():
     ]
     
     for i, test_case in enumerate(test_cases, 1):
-        print(f"{i}. {test_case['title']}")
-        print(f"   Input: {test_case['input']}")
-        print(f"   {test_case['description']}")
-        print()
+        _log(f"{i}. {test_case['title']}")
+        _log(f"   Input: {test_case['input']}")
+        _log(f"   {test_case['description']}")
+        _log()
         
         try:
-            result = engine.translate(test_case['input'])
+            result = translate_cached(test_case['input'])
             if result.success:
-                print("   Generated Python Code:")
-                for line in result.python_code.split('\n'):
-                    print(f"   {line}")
-                print()
+                _log("   Generated Python Code:")
+                _emit(result.python_code_lines, "   ")
+                _log()
             else:
-                print(f"   ❌ Error: {result.error_message}")
-                print()
+                _log(f"   ❌ Error: {result.error_message}")
+                _log()
         except Exception as e:
-            print(f"   ❌ Exception: {e}")
-            print()
+            _log(f"   ❌ Exception: {e}")
+            _log()
         
-        print("-" * 50)
-        print()
+        _log(SEP_DASH50)
+        _log()
 
 def demo_complete_workflow():
     """Demo a complete workflow with variable setup and conditionals"""
-    engine = TranslationEngine()
-    
-    print("🚀 COMPLETE WORKFLOW DEMO")
-    print("=" * 30)
-    print()
+    _log("🚀 COMPLETE WORKFLOW DEMO")
+    _log(SEP_EQ30)
+    _log()
     
     workflow_steps = [
         "set age to 20",
@@ -96,33 +95,35 @@ def demo_complete_workflow():
         "when temperature greater than 30 do print hot"
     ]
     
-    print("Workflow Steps:")
+    _log("Workflow Steps:")
     for i, step in enumerate(workflow_steps, 1):
-        print(f"{i}. {step}")
-    print()
+        _log(f"{i}. {step}")
+    _log()
     
-    print("Generated Python Code:")
-    print("-" * 20)
+    _log("Generated Python Code:")
+    _log(SEP_DASH20)
     
-    all_code = []
-    for step in workflow_steps:
-        try:
-            result = engine.translate(step)
-            if result.success:
-                all_code.append(result.python_code)
-            else:
-                all_code.append(f"# Error: {result.error_message}")
-        except Exception as e:
-            all_code.append(f"# Exception: {e}")
+    all_code = io.StringIO()
+    try:
+        results = translate_many(workflow_steps)
+    except Exception as e:
+        results = []
+        all_code.write(f"# Exception: {e}\n")
+    for result in results:
+        if result.success:
+            all_code.write(result.python_code)
+            all_code.write("\n")
+        else:
+            all_code.write(f"# Error: {result.error_message}\n")
     
-    final_code = '\n'.join(all_code)
-    print(final_code)
-    print()
+    final_code = all_code.getvalue().rstrip("\n")
+    _log(final_code)
+    _log()
     
-    print("Expected Output when run:")
-    print("adult")
-    print("excellent") 
-    print("hot")
+    _log("Expected Output when run:")
+    _log("adult")
+    _log("excellent") 
+    _log("hot")
 
 if __name__ == "__main__":
     demo_improved_conditionals()
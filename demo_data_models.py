@@ -11,6 +11,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from models import ParsedSentence, Operation, Condition, PatternType, TranslationResult, ExecutionResult
 
+# Separator lines
+SEP_EQ50 = "=" * 50
+
 def demo_parsed_sentence():
     """Demo ParsedSentence functionality"""
     print("=== ParsedSentence Demo ===")
@@ -113,7 +116,7 @@ def demo_execution_result():
 def main():
     """Main demo function"""
     print("English to Python Translator - Data Models Demo")
-    print("=" * 50)
+    print(SEP_EQ50)
     
     try:
         demo_parsed_sentence()
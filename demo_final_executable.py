@@ -3,144 +3,188 @@
 Demo Final - Menunjukkan kode yang bisa dieksekusi dengan output yang terlihat
 """
 
-import sys
-import os
+import io
+from dataclasses import dataclass
+from itertools import chain
 
-# Add src to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
+# _common adds src to sys.path and sets test mode
+from _common import demo_output
 
-# Set test mode to avoid GUI
-os.environ['PYTEST_CURRENT_TEST'] = 'true'
+_log, _emit = demo_output(__name__)
+
+try:
+    from _common import translate_cached, translate_many
+    from services.code_execution_service import CodeExecutionService
+    _AVAILABLE = True
+    # Eksekusi berjalan in-process dan tanpa state antar panggilan,
+    # jadi satu executor dipakai bersama oleh semua skenario
+    _EXECUTOR = CodeExecutionService()
+except ImportError:
+    _AVAILABLE = False
+    _EXECUTOR = None
+
+# Separator lines
+SEP_EQ50 = "=" * 50
+SEP_EQ60 = "=" * 60
+SEP_DASH40 = "-" * 40
+
+@dataclass(frozen=True)
+class Scenario:
+    """Satu skenario workflow beserta output yang diharapkan"""
+    __slots__ = ('title', 'inputs', 'expected_output')
+    title: str
+    inputs: tuple
+    expected_output: tuple
+
+def _run_scenario(scenario, translated):
+    """Assemble and execute one scenario from its pre-translated inputs"""
+    run = {"final_code": None, "code_blocks": [], "translation_error": None,
+           "exec_result": None, "output_lines": [], "matches_expected": False}
+    
+    # Look up the translation of every input
+    all_code = io.StringIO()
+    for input_text in scenario.inputs:
+        result = translated[input_text]
+        if result.success:
+            all_code.write(result.python_code)
+            all_code.write("\n")
+            run["code_blocks"].append(result.python_code_lines)
+        else:
+            run["translation_error"] = result.error_message
+            break
+    
+    if all_code.tell():
+        # Combine all code and execute it
+        run["final_code"] = all_code.getvalue().rstrip("\n")
+        exec_result = _EXECUTOR.execute_code(run["final_code"])
+        run["exec_result"] = exec_result
+        
+        if exec_result.success and exec_result.has_output():
+            output_lines = exec_result.get_combined_output().strip().split('\n')
+            expected = scenario.expected_output
+            run["output_lines"] = output_lines
+            run["matches_expected"] = (len(output_lines) == len(expected)
+                                       and frozenset(expected).issubset(output_lines))
+    
+    return run
+
+def _print_scenario(scenario, run):
+    """Print the results of one scenario produced by _run_scenario"""
+    _log(f"{scenario.title}")
+    _log(SEP_DASH40)
+    
+    _log("📋 INPUT SEQUENCE:")
+    for i, input_text in enumerate(scenario.inputs, 1):
+        _log(f"{i}. {input_text}")
+    _log()
+    
+    _log("🔄 TRANSLATING...")
+    if run["translation_error"] is not None:
+        _log(f"❌ Translation failed: {run['translation_error']}")
+    
+    if run["final_code"] is not None:
+        _log("🐍 GENERATED PYTHON CODE:")
+        _emit(chain.from_iterable(run["code_blocks"]))
+        _log()
+        
+        _log("▶️  EXECUTING...")
+        exec_result = run["exec_result"]
+        
+        if exec_result.success:
+            _log("✅ EXECUTION SUCCESS!")
+            if exec_result.has_output():
+                _log("📤 EXECUTION RESULT:")
+                _emit(run["output_lines"])
+                
+                # Check expected output
+                if run["matches_expected"]:
+                    _log("✅ OUTPUT MATCHES EXPECTED!")
+                else:
+                    _log(f"⚠️  Expected: {list(scenario.expected_output)}")
+                    _log(f"⚠️  Actual: {run['output_lines']}")
+            else:
+                _log("ℹ️  No output produced")
+        else:
+            _log("❌ EXECUTION FAILED!")
+            _log(f"Error: {exec_result.get_combined_error()}")
+    
+    _log()
 
 def demo_executable_workflow():
     """Demo workflow yang bisa dieksekusi dengan output yang jelas"""
     
+    if not _AVAILABLE:
+        _log("❌ Import error: translation engine tidak tersedia")
+        return
+    
     try:
-        from services.translation_engine import TranslationEngine
-        from services.code_execution_service import CodeExecutionService
-        
-        engine = TranslationEngine()
-        executor = CodeExecutionService()
-        
-        print("🎯 DEMO FINAL: KODE YANG BISA DIEKSEKUSI")
-        print("=" * 50)
-        print()
+        _log("🎯 DEMO FINAL: KODE YANG BISA DIEKSEKUSI")
+        _log(SEP_EQ50)
+        _log()
         
         scenarios = [
-            {
-                "title": "🎓 Sistem Penilaian Siswa",
-                "inputs": [
+            Scenario(
+                "🎓 Sistem Penilaian Siswa",
+                (
                     "set student_name to Alice",
-                    "set math_score to 85", 
+                    "set math_score to 85",
                     "set english_score to 92",
                     "if math_score greater than 80 then print good_math else print poor_math",
-                    "if english_score greater than 90 then print excellent_english else print good_english"
-                ],
-                "expected_output": ["good_math", "excellent_english"]
-            },
-            {
-                "title": "🌡️ Monitoring Cuaca",
-                "inputs": [
+                    "if english_score greater than 90 then print excellent_english else print good_english",
+                ),
+                ("good_math", "excellent_english"),
+            ),
+            Scenario(
+                "🌡️ Monitoring Cuaca",
+                (
                     "set temperature to 35",
                     "set humidity to 75",
                     "if temperature greater than 30 then print hot else print normal",
-                    "when humidity greater than 70 do print humid"
-                ],
-                "expected_output": ["hot", "humid"]
-            },
-            {
-                "title": "🎮 Game Scoring",
-                "inputs": [
+                    "when humidity greater than 70 do print humid",
+                ),
+                ("hot", "humid"),
+            ),
+            Scenario(
+                "🎮 Game Scoring",
+                (
                     "set current_score to 2500",
                     "set lives_remaining to 3",
                     "if current_score greater than 2000 then print high_score else print low_score",
-                    "when lives_remaining greater than 0 do print still_playing"
-                ],
-                "expected_output": ["high_score", "still_playing"]
-            }
+                    "when lives_remaining greater than 0 do print still_playing",
+                ),
+                ("high_score", "still_playing"),
+            ),
         ]
         
+        # Terjemahkan setiap input unik sekali saja untuk semua skenario
+        unique_inputs = list(dict.fromkeys(
+            input_text for scenario in scenarios for input_text in scenario.inputs
+        ))
+        translated = dict(zip(unique_inputs, translate_many(unique_inputs)))
+        
+        # Skenario dijalankan berurutan: execute_code memakai redirect_stdout
+        # (global per proses) dan SIGALRM (hanya di main thread)
         for scenario in scenarios:
-            print(f"{scenario['title']}")
-            print("-" * 40)
-            
-            print("📋 INPUT SEQUENCE:")
-            for i, input_text in enumerate(scenario['inputs'], 1):
-                print(f"{i}. {input_text}")
-            print()
-            
-            # Translate all inputs
-            all_code = []
-            print("🔄 TRANSLATING...")
-            
-            for input_text in scenario['inputs']:
-                result = engine.translate(input_text)
-                if result.success:
-                    all_code.append(result.python_code)
-                else:
-                    print(f"❌ Translation failed: {result.error_message}")
-                    break
-            
-            if all_code:
-                # Combine all code
-                final_code = '\n'.join(all_code)
-                
-                print("🐍 GENERATED PYTHON CODE:")
-                for line in final_code.split('\n'):
-                    print(f"    {line}")
-                print()
-                
-                # Execute the code
-                print("▶️  EXECUTING...")
-                exec_result = executor.execute_code(final_code)
-                
-                if exec_result.success:
-                    print("✅ EXECUTION SUCCESS!")
-                    if exec_result.has_output():
-                        output_lines = exec_result.get_combined_output().strip().split('\n')
-                        print("📤 EXECUTION RESULT:")
-                        for line in output_lines:
-                            print(f"    {line}")
-                        
-                        # Check expected output
-                        expected = scenario['expected_output']
-                        actual = output_lines
-                        
-                        if len(actual) == len(expected) and all(exp in actual for exp in expected):
-                            print("✅ OUTPUT MATCHES EXPECTED!")
-                        else:
-                            print(f"⚠️  Expected: {expected}")
-                            print(f"⚠️  Actual: {actual}")
-                    else:
-                        print("ℹ️  No output produced")
-                else:
-                    print("❌ EXECUTION FAILED!")
-                    print(f"Error: {exec_result.get_combined_error()}")
-            
-            print()
-            print("=" * 50)
-            print()
+            _print_scenario(scenario, _run_scenario(scenario, translated))
+            _log(SEP_EQ50)
+            _log()
             
     except ImportError as e:
-        print(f"❌ Import error: {e}")
+        _log(f"❌ Import error: {e}")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        _log(f"❌ Unexpected error: {e}")
 
 def demo_individual_features():
     """Demo fitur-fitur individual yang sudah diperbaiki"""
     
+    if not _AVAILABLE:
+        _log("❌ Import error: translation engine tidak tersedia")
+        return
+    
     try:
-        from services.translation_engine import TranslationEngine
-        from services.code_execution_service import CodeExecutionService
-        
-        engine = TranslationEngine()
-        executor = CodeExecutionService()
-        
-        print("✨ DEMO: FITUR-FITUR YANG SUDAH DIPERBAIKI")
-        print("=" * 50)
-        print()
+        _log("✨ DEMO: FITUR-FITUR YANG SUDAH DIPERBAIKI")
+        _log(SEP_EQ50)
+        _log()
         
         features = [
             {
@@ -179,75 +223,73 @@ def demo_individual_features():
         ]
         
         for i, feature in enumerate(features, 1):
-            print(f"{i}. {feature['title']}")
-            print(f"   {feature['description']}")
-            print(f"   Input: {feature['input']}")
-            print("-" * 40)
+            _log(f"{i}. {feature['title']}")
+            _log(f"   {feature['description']}")
+            _log(f"   Input: {feature['input']}")
+            _log(SEP_DASH40)
             
             # Setup if needed
             setup_code = ""
             if 'setup' in feature:
-                setup_result = engine.translate(feature['setup'])
+                setup_result = translate_cached(feature['setup'])
                 if setup_result.success:
                     setup_code = setup_result.python_code + '\n'
             
             # Main translation
-            result = engine.translate(feature['input'])
+            result = translate_cached(feature['input'])
             
             if result.success:
-                print("✅ Translation Success!")
+                _log("✅ Translation Success!")
                 full_code = setup_code + result.python_code
                 
-                print("   Generated Code:")
-                for line in full_code.split('\n'):
-                    if line.strip():
-                        print(f"       {line}")
+                _log("   Generated Code:")
+                _emit((line for line in full_code.split('\n') if line.strip()), "       ")
                 
                 # Execute if there's expected output
                 if 'expected_output' in feature:
-                    exec_result = executor.execute_code(full_code)
+                    exec_result = _EXECUTOR.execute_code(full_code)
                     if exec_result.success and exec_result.has_output():
                         output = exec_result.get_combined_output().strip()
-                        print(f"   Output: {output}")
+                        _log(f"   Output: {output}")
                         
                         if feature['expected_output'] in output:
-                            print("   ✅ Output correct!")
+                            _log("   ✅ Output correct!")
                         else:
-                            print(f"   ⚠️  Expected: {feature['expected_output']}")
+                            _log(f"   ⚠️  Expected: {feature['expected_output']}")
                     else:
-                        print("   ❌ Execution failed or no output")
+                        _log("   ❌ Execution failed or no output")
                 
             else:
-                print("❌ Translation Failed!")
-                print(f"   Error: {result.error_message}")
+                _log("❌ Translation Failed!")
+                _log(f"   Error: {result.error_message}")
             
-            print()
+            _log()
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
+        _log(f"❌ Import error: {e}")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        _log(f"❌ Unexpected error: {e}")
 
 def main():
     """Main demo function"""
     
-    print("🎉 DEMO FINAL: ENGLISH TO PYTHON TRANSLATOR")
-    print("🎯 SEMUA FITUR SUDAH BEKERJA DAN BISA DIEKSEKUSI!")
-    print("=" * 60)
-    print()
+    _log("🎉 DEMO FINAL: ENGLISH TO PYTHON TRANSLATOR")
+    _log("🎯 SEMUA FITUR SUDAH BEKERJA DAN BISA DIEKSEKUSI!")
+    _log(SEP_EQ60)
+    _log()
     
     demo_executable_workflow()
     demo_individual_features()
     
-    print("🎊 KESIMPULAN:")
-    print("✅ Kode Python yang dihasilkan bisa dieksekusi")
-    print("✅ Output muncul di Execution Result")
-    print("✅ Assignment values ditangani dengan benar")
-    print("✅ Print statements menghasilkan output yang terlihat")
-    print("✅ Conditional logic bekerja sesuai ekspektasi")
-    print("✅ Semua fitur conditional statements sudah diperbaiki!")
-    print()
-    print("🚀 Siap digunakan di aplikasi dengan 'Run Code'!")
+    _log("🎊 KESIMPULAN:")
+    _log("✅ Kode Python yang dihasilkan bisa dieksekusi")
+    _log("✅ Output muncul di Execution Result")
+    _log("✅ Assignment values ditangani dengan benar")
+    _log("✅ Print statements menghasilkan output yang terlihat")
+    _log("✅ Conditional logic bekerja sesuai ekspektasi")
+    _log("✅ Semua fitur conditional statements sudah diperbaiki!")
+    _log()
+    _log("🚀 Siap digunakan di aplikasi dengan 'Run Code'!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
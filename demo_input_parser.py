@@ -12,11 +12,23 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.core import InputParser
 from src.models import PatternType
 
+# Separator lines
+SEP_EQ60 = "=" * 60
+
+_PARSER = None
+
+def _get_parser():
+    """Get the shared InputParser, created on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = InputParser()
+    return _PARSER
+
 def demo_arithmetic_parsing():
     """Demo parsing arithmetic sentences"""
     print("=== Arithmetic Pattern Parsing ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         "add x and y",
@@ -26,23 +38,25 @@ def demo_arithmetic_parsing():
         "sum total and count"
     ]
     
-    for sentence in test_sentences:
-        parsed = parser.parse_sentence(sentence)
-        print(f"Input: '{sentence}'")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Variables: {parsed.variables}")
-        print(f"  Operations: {len(parsed.operations)}")
+    for sentence, parsed in zip(test_sentences, parser.parse_many(test_sentences)):
+        report = [
+            f"Input: '{sentence}'",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Variables: {parsed.variables}",
+            f"  Operations: {len(parsed.operations)}",
+        ]
         if parsed.operations:
             op = parsed.operations[0]
-            print(f"    Type: {op.operation_type}, Operands: {op.operands}")
-        print(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
-        print()
+            report.append(f"    Type: {op.operation_type}, Operands: {op.operands}")
+        report.append(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
+        report.append("")
+        print("\n".join(report))
 
 def demo_conditional_parsing():
     """Demo parsing conditional sentences"""
     print("=== Conditional Pattern Parsing ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         "if x > 5 then print hello",
@@ -50,23 +64,25 @@ def demo_conditional_parsing():
         "if temperature is high then turn on fan"
     ]
     
-    for sentence in test_sentences:
-        parsed = parser.parse_sentence(sentence)
-        print(f"Input: '{sentence}'")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Conditions: {len(parsed.conditions)}")
+    for sentence, parsed in zip(test_sentences, parser.parse_many(test_sentences)):
+        report = [
+            f"Input: '{sentence}'",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Conditions: {len(parsed.conditions)}",
+        ]
         if parsed.conditions:
             cond = parsed.conditions[0]
-            print(f"    Text: {cond.condition_text}")
-            print(f"    Variables used: {cond.variables_used}")
-        print(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
-        print()
+            report.append(f"    Text: {cond.condition_text}")
+            report.append(f"    Variables used: {cond.variables_used}")
+        report.append(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
+        report.append("")
+        print("\n".join(report))
 
 def demo_data_operation_parsing():
     """Demo parsing data operation sentences"""
     print("=== Data Operation Pattern Parsing ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         "create list with items",
@@ -75,23 +91,25 @@ def demo_data_operation_parsing():
         "get value from dictionary"
     ]
     
-    for sentence in test_sentences:
-        parsed = parser.parse_sentence(sentence)
-        print(f"Input: '{sentence}'")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Variables: {parsed.variables}")
-        print(f"  Operations: {len(parsed.operations)}")
+    for sentence, parsed in zip(test_sentences, parser.parse_many(test_sentences)):
+        report = [
+            f"Input: '{sentence}'",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Variables: {parsed.variables}",
+            f"  Operations: {len(parsed.operations)}",
+        ]
         if parsed.operations:
             op = parsed.operations[0]
-            print(f"    Type: {op.operation_type}, Operands: {op.operands}")
-        print(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
-        print()
+            report.append(f"    Type: {op.operation_type}, Operands: {op.operands}")
+        report.append(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
+        report.append("")
+        print("\n".join(report))
 
 def demo_loop_parsing():
     """Demo parsing loop sentences"""
     print("=== Loop Pattern Parsing ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         "repeat 5 times",
@@ -99,20 +117,22 @@ def demo_loop_parsing():
         "while condition is true"
     ]
     
-    for sentence in test_sentences:
-        parsed = parser.parse_sentence(sentence)
-        print(f"Input: '{sentence}'")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Variables: {parsed.variables}")
-        print(f"  Operations: {len(parsed.operations)}")
-        print(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
-        print()
+    for sentence, parsed in zip(test_sentences, parser.parse_many(test_sentences)):
+        report = [
+            f"Input: '{sentence}'",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Variables: {parsed.variables}",
+            f"  Operations: {len(parsed.operations)}",
+            f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}",
+            "",
+        ]
+        print("\n".join(report))
 
 def demo_assignment_parsing():
     """Demo parsing assignment sentences"""
     print("=== Assignment Pattern Parsing ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         "set x to 5",
@@ -120,24 +140,26 @@ def demo_assignment_parsing():
         "assign 42 to result"
     ]
     
-    for sentence in test_sentences:
-        parsed = parser.parse_sentence(sentence)
-        print(f"Input: '{sentence}'")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Variables: {parsed.variables}")
-        print(f"  Operations: {len(parsed.operations)}")
+    for sentence, parsed in zip(test_sentences, parser.parse_many(test_sentences)):
+        report = [
+            f"Input: '{sentence}'",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Variables: {parsed.variables}",
+            f"  Operations: {len(parsed.operations)}",
+        ]
         if parsed.operations:
             op = parsed.operations[0]
-            print(f"    Type: {op.operation_type}")
-            print(f"    Result variable: {op.result_variable}")
-        print(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
-        print()
+            report.append(f"    Type: {op.operation_type}")
+            report.append(f"    Result variable: {op.result_variable}")
+        report.append(f"  Confidence: {parsed.metadata.get('confidence', 0):.2f}")
+        report.append("")
+        print("\n".join(report))
 
 def demo_validation():
     """Demo input validation"""
     print("=== Input Validation Demo ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_inputs = [
         "add x and y",  # Valid
@@ -151,16 +173,19 @@ def demo_validation():
     for input_text in test_inputs:
         valid, message = parser.validate_input(input_text)
         display_text = input_text[:50] + "..." if len(input_text) > 50 else input_text
-        print(f"Input: '{display_text}'")
-        print(f"  Valid: {valid}")
-        print(f"  Message: {message}")
-        print()
+        report = [
+            f"Input: '{display_text}'",
+            f"  Valid: {valid}",
+            f"  Message: {message}",
+            "",
+        ]
+        print("\n".join(report))
 
 def demo_pattern_confidence():
     """Demo confidence scoring"""
     print("=== Pattern Confidence Demo ===")
     
-    parser = InputParser()
+    parser = _get_parser()
     
     test_sentences = [
         ("add x and y", "Clear arithmetic"),
@@ -170,19 +195,22 @@ def demo_pattern_confidence():
         ("create list with items", "Clear data operation")
     ]
     
-    for sentence, description in test_sentences:
-        parsed = parser.parse_sentence(sentence)
+    parsed_sentences = parser.parse_many([sentence for sentence, _ in test_sentences])
+    for (sentence, description), parsed in zip(test_sentences, parsed_sentences):
         confidence = parsed.metadata.get('confidence', 0)
-        print(f"Input: '{sentence}' ({description})")
-        print(f"  Pattern: {parsed.pattern_type.value}")
-        print(f"  Confidence: {confidence:.2f}")
-        print(f"  Valid: {parsed.is_valid()}")
-        print()
+        report = [
+            f"Input: '{sentence}' ({description})",
+            f"  Pattern: {parsed.pattern_type.value}",
+            f"  Confidence: {confidence:.2f}",
+            f"  Valid: {parsed.is_valid()}",
+            "",
+        ]
+        print("\n".join(report))
 
 def main():
     """Main demo function"""
     print("English to Python Translator - Input Parser Demo")
-    print("=" * 60)
+    print(SEP_EQ60)
     
     try:
         demo_arithmetic_parsing()
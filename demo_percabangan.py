@@ -4,22 +4,18 @@ Demo Percabangan - English to Python Translator
 Contoh input untuk conditional statements (if-then-else)
 """
 
-import sys
-import os
+# _common adds src to sys.path and sets test mode
+from _common import demo_output, translate_cached, translate_many
 
-# Add src directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
+_log, _emit = demo_output(__name__)
 
-from services.translation_engine import TranslationEngine
+# Separator lines
+SEP_EQ60 = "=" * 60
+SEP_DASH60 = "-" * 60
 
 def demo_percabangan():
     """Demo berbagai jenis percabangan"""
-    engine = TranslationEngine()
-    
-    print("🌟 === DEMO PERCABANGAN (CONDITIONAL STATEMENTS) ===\n")
+    _log("🌟 === DEMO PERCABANGAN (CONDITIONAL STATEMENTS) ===\n")
     
     # Contoh percabangan yang didukung
     contoh_percabangan = [
@@ -49,34 +45,30 @@ def demo_percabangan():
     ]
     
     for i, instruction in enumerate(contoh_percabangan, 1):
-        print(f"📝 {i}. INPUT:")
-        print(f"   {instruction}")
-        print(f"🐍 PYTHON OUTPUT:")
+        _log(f"📝 {i}. INPUT:")
+        _log(f"   {instruction}")
+        _log(f"🐍 PYTHON OUTPUT:")
         
-        result = engine.translate(instruction)
+        result = translate_cached(instruction)
         
         if result.success:
             # Tampilkan kode dengan indentasi yang benar
-            lines = result.python_code.split('\n')
-            for line in lines:
-                print(f"   {line}")
+            _emit(result.python_code_lines, "   ")
             
             # Tampilkan warnings jika ada
             if result.warnings:
-                print(f"⚠️  WARNINGS:")
+                _log(f"⚠️  WARNINGS:")
                 for warning in result.warnings:
-                    print(f"   - {warning}")
+                    _log(f"   - {warning}")
         else:
-            print(f"❌ ERROR: {result.error_message}")
+            _log(f"❌ ERROR: {result.error_message}")
         
-        print("-" * 60)
-        print()
+        _log(SEP_DASH60)
+        _log()
 
 def demo_kombinasi_percabangan():
     """Demo kombinasi percabangan dengan assignment"""
-    engine = TranslationEngine()
-    
-    print("🔥 === DEMO KOMBINASI PERCABANGAN + ASSIGNMENT ===\n")
+    _log("🔥 === DEMO KOMBINASI PERCABANGAN + ASSIGNMENT ===\n")
     
     # Contoh kombinasi yang bisa dicoba satu per satu
     kombinasi = [
@@ -91,19 +83,19 @@ def demo_kombinasi_percabangan():
         "if temperature greater than 30 then print hot weather"
     ]
     
-    print("💡 CARA PENGGUNAAN:")
-    print("   Masukkan instruksi ini satu per satu di aplikasi:\n")
+    _log("💡 CARA PENGGUNAAN:")
+    _log("   Masukkan instruksi ini satu per satu di aplikasi:\n")
     
-    for i, instruction in enumerate(kombinasi, 1):
-        print(f"{i}. {instruction}")
+    # Terjemahkan sekali untuk menunjukkan hasilnya
+    results = translate_many(kombinasi)
+    for i, (instruction, result) in enumerate(zip(kombinasi, results), 1):
+        _log(f"{i}. {instruction}")
         
-        # Terjemahkan untuk menunjukkan hasilnya
-        result = engine.translate(instruction)
         if result.success:
-            print(f"   → {result.python_code}")
-        print()
+            _log(f"   → {result.python_code}")
+        _log()
 
 if __name__ == "__main__":
     demo_percabangan()
-    print("\n" + "="*60 + "\n")
+    _log("\n" + SEP_EQ60 + "\n")
     demo_kombinasi_percabangan()
\ No newline at end of file
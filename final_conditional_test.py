@@ -18,9 +18,7 @@ def test_conditional_improvements():
     """Test the improved conditional functionality"""
     
     try:
-        from services.translation_engine import TranslationEngine
-        
-        engine = TranslationEngine()
+        from _common import emit_indented, translate_cached
         
         print("🎉 FINAL TEST: IMPROVED CONDITIONAL STATEMENTS")
         print("=" * 55)
@@ -47,13 +45,12 @@ def test_conditional_improvements():
             print("-" * 50)
             
             try:
-                result = engine.translate(test_case['input'])
+                result = translate_cached(test_case['input'])
                 
                 if result.success:
                     print("✅ SUCCESS!")
                     print("Generated Python Code:")
-                    for line in result.python_code.split('\n'):
-                        print(f"    {line}")
+                    emit_indented(result.python_code_lines, "    ")
                     
                     if result.has_warnings():
                         print("Warnings:")
@@ -3,53 +3,48 @@
 Fix untuk menangani multiple statements dalam satu input
 """
 
-import sys
-import os
+import re
 
-# Add src to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
+# Common statement beginnings, tried at each occurrence of their leading keyword
+_STATEMENT_KEYWORDS = ('set', 'if', 'when', 'create', 'add')
+_STATEMENT_START_RE = re.compile(
+    r'set\s+\w+\s+to\s+'    # "set variable to"
+    r'|if\s+\w+\s+'         # "if variable"
+    r'|when\s+\w+\s+'       # "when variable"
+    r'|create\s+'           # "create"
+    r'|add\s+\w+\s+and\s+'  # "add X and Y"
+)
 
-# Set test mode to avoid GUI
-os.environ['PYTEST_CURRENT_TEST'] = 'true'
+def _find_statement_starts(line: str) -> list:
+    """Return sorted offsets in line where a new statement begins"""
+    # str.find skips straight to keyword candidates; the regex only confirms them
+    match = _STATEMENT_START_RE.match
+    find = line.find
+    starts = set()
+    for keyword in _STATEMENT_KEYWORDS:
+        pos = find(keyword)
+        while pos != -1:
+            # Keyword must start a word (same as the regex \b)
+            if (pos == 0 or not (line[pos - 1].isalnum() or line[pos - 1] == '_')) and match(line, pos):
+                starts.add(pos)
+            pos = find(keyword, pos + 1)
+    return sorted(starts)
 
 def split_multiline_input(input_text: str) -> list:
     """Split multiline input into individual statements"""
     
-    # Split by newlines first
-    lines = input_text.strip().split('\n')
-    statements = []
-    
-    for line in lines:
-        line = line.strip()
-        if line:  # Skip empty lines
-            statements.append(line)
+    # Split by newlines first, skipping empty lines
+    statements = [s for s in (ln.strip() for ln in input_text.splitlines()) if s]
     
     # If no newlines, try to detect multiple statements in one line
     if len(statements) == 1:
         single_line = statements[0]
-        
-        # Look for patterns that indicate multiple statements
-        # Pattern: "set ... to ..." followed by another "set" or "if"
-        import re
-        
-        # Split on common statement beginnings
-        patterns = [
-            r'(?=\bset\s+\w+\s+to\s+)',  # Before "set variable to"
-            r'(?=\bif\s+\w+\s+)',        # Before "if variable"
-            r'(?=\bwhen\s+\w+\s+)',      # Before "when variable"
-            r'(?=\bcreate\s+)',          # Before "create"
-            r'(?=\badd\s+\w+\s+and\s+)', # Before "add X and Y"
-        ]
-        
-        # Try each pattern
-        for pattern in patterns:
-            parts = re.split(pattern, single_line)
-            if len(parts) > 1:
-                # Filter out empty parts and clean up
-                statements = [part.strip() for part in parts if part.strip()]
-                break
+        bounds = _find_statement_starts(single_line)
+        if bounds and bounds != [0]:
+            bounds = [0] + bounds + [len(single_line)]
+            parts = [single_line[a:b] for a, b in zip(bounds, bounds[1:])]
+            # Filter out empty parts and clean up
+            statements = [part.strip() for part in parts if part.strip()]
     
     return statements
 
@@ -57,10 +52,10 @@ def test_multiline_fix():
     """Test fix untuk multiline input"""
     
     try:
-        from services.translation_engine import TranslationEngine
+        # _common adds src to sys.path and sets test mode
+        from _common import emit_indented, translate_cached
         from services.code_execution_service import CodeExecutionService
         
-        engine = TranslationEngine()
         executor = CodeExecutionService()
         
         print("🔧 TEST: FIX MULTILINE INPUT")
@@ -96,12 +91,11 @@ if english_score greater than 90 then print excellent_english else print good_en
         for i, stmt in enumerate(statements, 1):
             print(f"Statement {i}: {stmt}")
             
-            result = engine.translate(stmt)
+            result = translate_cached(stmt)
             if result.success:
                 print("✅ Success")
                 all_code.append(result.python_code)
-                for line in result.python_code.split('\n'):
-                    print(f"    {line}")
+                emit_indented(result.python_code_lines, "    ")
             else:
                 print(f"❌ Failed: {result.error_message}")
                 return
@@ -140,9 +134,7 @@ def test_single_line_multiple_statements():
     """Test input dengan multiple statements dalam satu line"""
     
     try:
-        from services.translation_engine import TranslationEngine
-        
-        engine = TranslationEngine()
+        from _common import emit_indented, translate_cached
         
         print("🧪 TEST: SINGLE LINE MULTIPLE STATEMENTS")
         print("=" * 45)
@@ -168,11 +160,10 @@ def test_single_line_multiple_statements():
             print(f"🔄 Translating Statement {i}:")
             print(f"   Input: {stmt}")
             
-            result = engine.translate(stmt)
+            result = translate_cached(stmt)
             if result.success:
                 print("   ✅ Success")
-                for line in result.python_code.split('\n'):
-                    print(f"       {line}")
+                emit_indented(result.python_code_lines, "       ")
             else:
                 print(f"   ❌ Failed: {result.error_message}")
             print()
@@ -8,6 +8,7 @@ It initializes all components, sets up the GUI, and starts the main event loop w
 error handling for application startup.
 """
 
+import importlib.util
 import sys
 import os
 import logging
@@ -72,10 +73,11 @@ def check_dependencies() -> bool:
         missing_modules = []
         
         for module_name, description in required_modules:
-            try:
-                __import__(module_name)
+            # find_spec locates the module without executing it; the real
+            # imports happen in initialize_application
+            if importlib.util.find_spec(module_name) is not None:
                 logger.info(f"✓ {module_name} ({description}) - Available")
-            except ImportError:
+            else:
                 missing_modules.append((module_name, description))
                 logger.error(f"✗ {module_name} ({description}) - Missing")
         
@@ -9,11 +9,11 @@ import sys
 import subprocess
 import platform
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+def run_command(argv, description):
+    """Run a command (list of arguments, no shell) and handle errors"""
     print(f"\n{description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
         print(f"✓ {description} berhasil")
         return True
     except subprocess.CalledProcessError as e:
@@ -21,6 +21,10 @@ def run_command(command, description):
         print(f"Output: {e.stdout}")
         print(f"Error: {e.stderr}")
         return False
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting non-zero
+        print(f"✗ Error: {e}")
+        return False
 
 def main():
     """Main setup function"""
@@ -37,7 +41,7 @@ def main():
     # Create virtual environment
     venv_name = "venv"
     if not os.path.exists(venv_name):
-        if not run_command(f"{sys.executable} -m venv {venv_name}", "Membuat virtual environment"):
+        if not run_command([sys.executable, "-m", "venv", venv_name], "Membuat virtual environment"):
             sys.exit(1)
     else:
         print(f"✓ Virtual environment '{venv_name}' sudah ada")
@@ -45,24 +49,21 @@ def main():
     # Determine activation command based on OS
     if platform.system() == "Windows":
         activate_cmd = f"{venv_name}\\Scripts\\activate"
-        pip_cmd = f"{venv_name}\\Scripts\\pip"
+        venv_python = os.path.join(venv_name, "Scripts", "python")
     else:
         activate_cmd = f"source {venv_name}/bin/activate"
-        pip_cmd = f"{venv_name}/bin/pip"
-    
-    # Install dependencies
-    if not run_command(f"{pip_cmd} install --upgrade pip", "Upgrade pip"):
-        sys.exit(1)
+        venv_python = os.path.join(venv_name, "bin", "python")
     
-    if not run_command(f"{pip_cmd} install -r requirements.txt", "Install dependencies"):
+    # Upgrade pip and install dependencies in a single pip run
+    if not run_command([venv_python, "-m", "pip", "install", "--upgrade", "pip", "-r", "requirements.txt"],
+                       "Upgrade pip dan install dependencies"):
         sys.exit(1)
     
     # Download NLTK data
     print("\nDownloading NLTK data...")
     try:
         import nltk
-        nltk.download('punkt', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
+        nltk.download(['punkt', 'averaged_perceptron_tagger'], quiet=True)
         print("✓ NLTK data downloaded")
     except Exception as e:
         print(f"⚠ Warning: Could not download NLTK data: {e}")
@@ -2,118 +2,295 @@
 Code Generator component for English to Python Translator
 """
 
-import ast
-from typing import Dict, List, Optional, Any, Tuple
+import inspect
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Any, Set, Tuple
 
 from ..models.parsed_sentence import ParsedSentence, Operation, Condition, PatternType
 from ..models.translation_result import TranslationResult
 
+# Bound once here; generate() builds one of these for every sentence
+_create_error = TranslationResult.create_error
+_create_success = TranslationResult.create_success
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(code: str) -> Tuple[bool, str]:
+    """Compile code once per distinct string; template output repeats a lot across sentences"""
+    try:
+        # A plain compile checks the syntax without building a Python-level AST,
+        # and also rejects code like a top-level 'return' that could never run
+        compile(code, '<generated>', 'exec', dont_inherit=True)
+        return True, ""
+    except SyntaxError as e:
+        error_msg = f"Line {e.lineno}: {e.msg}"
+        return False, error_msg
+    except Exception as e:
+        return False, str(e)
+
+
+# Piece snippets seen once by _is_valid_piece. A piece is only compiled on its
+# own when it comes back, so a sentence made of new pieces costs one compile of
+# the whole snippet instead of one per piece plus the fallback
+_seen_pieces: Set[str] = set()
+_MAX_SEEN_PIECES = 4096
+
+
+def _is_valid_piece(snippet: str) -> bool:
+    """Whether a piece snippet seen before compiles; False on its first sighting"""
+    if snippet in _seen_pieces:
+        return _validate_cached(snippet)[0]
+    if len(_seen_pieces) >= _MAX_SEEN_PIECES:
+        _seen_pieces.clear()
+    _seen_pieces.add(snippet)
+    return False
+
+
+def _is_valid_condition(condition: Any) -> bool:
+    """Whether condition works as the test of an if/while header, on one line"""
+    return (isinstance(condition, str) and '\n' not in condition and '\r' not in condition
+            and _is_valid_piece(f'if {condition}:\n    pass'))
+
+
+def _is_valid_block_line(line: Any) -> bool:
+    """Whether line works as the only statement of an indented block"""
+    return (isinstance(line, str) and '\n' not in line and '\r' not in line
+            and _is_valid_piece(f'if _:\n    {line}'))
+
+
+# English comparison phrases and their Python operators, most frequent first
+# (counted over the conditions in INPUT_EXAMPLES.txt and the guides/demos) so
+# the common phrases are tried first. A phrase must still come before any
+# shorter phrase it starts with, so 'is equal to' stays ahead of 'is'.
+# The identity phrases (and / or / not) are left out since replacing them
+# would change nothing.
+_CONDITION_REPLACEMENTS = {
+    'greater than': '>',
+    'less than': '<',
+    'equals': '==',
+    'is equal to': '==',
+    'is': '==',
+}
+
+# One alternation in the order above. The trailing space is a lookahead so
+# adjacent phrases can share it.
+_CONDITION_RE = re.compile(
+    ' (' + '|'.join(re.escape(phrase) for phrase in _CONDITION_REPLACEMENTS) + ')(?= )'
+)
+
+
+def _replace_condition_phrase(match: re.Match) -> str:
+    return ' ' + _CONDITION_REPLACEMENTS[match.group(1)]
+
+
+@lru_cache(maxsize=4096)
+def _format_condition_cached(condition_text: str) -> str:
+    """Rewrite comparison phrases once per distinct condition; batches repeat them often"""
+    return _CONDITION_RE.sub(_replace_condition_phrase, condition_text.strip())
+
+
+# Divisors that are zero at a glance; anything else numeric goes through float()
+_ZERO_LITERALS = frozenset(('0', '0.0', '0.00', '-0', '-0.0', '.0'))
+# Strings float() could parse: optional surrounding whitespace and underscores
+# between digits, as in '0_0'. Identifiers like 'y' fail here without raising.
+_DIGITS = r'\d(?:_?\d)*'
+_NUMBER_RE = re.compile(
+    rf'\s*[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?\s*'
+)
+
+
+def _is_zero_divisor(operand: Any) -> bool:
+    """Whether a divisor is numerically zero, as float(operand) == 0 would say"""
+    if isinstance(operand, str):
+        if operand in _ZERO_LITERALS:
+            return True
+        if not _NUMBER_RE.fullmatch(operand):
+            return False
+    try:
+        return float(operand) == 0
+    except (ValueError, TypeError):
+        return False
+
+
+# Lines starting with these are block bodies and are kept verbatim by format_code
+_INDENT_PREFIXES = ('    ', '\t')
+
+
+# Code templates per construct as precompiled f-string functions, so format
+# strings are not re-parsed for every sentence. Read-only so every generator
+# shares one copy; the str.format view in _TEMPLATES is derived from these.
+_TEMPLATE_FNS: Mapping[str, Callable[..., str]] = MappingProxyType({
+    'arithmetic_add': lambda result, operand1, operand2: f'{result} = {operand1} + {operand2}',
+    'arithmetic_subtract': lambda result, operand1, operand2: f'{result} = {operand1} - {operand2}',
+    'arithmetic_multiply': lambda result, operand1, operand2: f'{result} = {operand1} * {operand2}',
+    'arithmetic_divide': lambda result, operand1, operand2: f'{result} = {operand1} / {operand2}',
+    'assignment': lambda variable, value: f'{variable} = {value}',
+    'conditional_if': lambda condition, then_block: f'if {condition}:\n    {then_block}',
+    'conditional_if_else': lambda condition, then_block, else_block: (
+        f'if {condition}:\n    {then_block}\nelse:\n    {else_block}'
+    ),
+    'loop_repeat': lambda count, body: f'for _ in range({count}):\n    {body}',
+    'loop_for_each': lambda item, collection, body: f'for {item} in {collection}:\n    {body}',
+    'loop_while': lambda condition, body: f'while {condition}:\n    {body}',
+    'list_create': lambda variable, items: f'{variable} = [{items}]',
+    'list_append': lambda list_var, item: f'{list_var}.append({item})',
+    'dict_create': lambda variable, items: f'{variable} = {{{items}}}',
+    'string_create': lambda variable, value: f'{variable} = "{value}"',
+})
+
+
+def _format_string(template_fn: Callable[..., str]) -> str:
+    """Recover the str.format template a _TEMPLATE_FNS function renders"""
+    names = inspect.signature(template_fn).parameters
+    # Render with sentinel placeholders, escape the literal braces the function
+    # emits, then turn each sentinel into its {name} field
+    code = template_fn(*(f'\0{name}\0' for name in names))
+    code = code.replace('{', '{{').replace('}', '}}')
+    for name in names:
+        code = code.replace(f'\0{name}\0', f'{{{name}}}')
+    return code
+
+
+# Public str.format view of the templates, kept for CodeGenerator.TEMPLATES
+_TEMPLATES = MappingProxyType({
+    key: _format_string(template_fn) for key, template_fn in _TEMPLATE_FNS.items()
+})
+
+# Arithmetic templates keyed directly by Operation.operation_type
+_ARITHMETIC_FNS: Mapping[str, Callable[..., str]] = MappingProxyType({
+    'add': _TEMPLATE_FNS['arithmetic_add'],
+    'subtract': _TEMPLATE_FNS['arithmetic_subtract'],
+    'multiply': _TEMPLATE_FNS['arithmetic_multiply'],
+    'divide': _TEMPLATE_FNS['arithmetic_divide'],
+})
+
+
+# Literal formatters keyed on the exact value type; _format_value falls back to
+# isinstance for subclasses and to str() for everything else
+_VALUE_FORMATTERS: Mapping[type, Callable[[Any], str]] = MappingProxyType({
+    str: lambda value: f'"{value}"',
+})
+
 
 class CodeGenerator:
     """Generates valid Python code from parsed English sentences"""
     
-    TEMPLATES = {
-        'arithmetic_add': '{result} = {operand1} + {operand2}',
-        'arithmetic_subtract': '{result} = {operand1} - {operand2}',
-        'arithmetic_multiply': '{result} = {operand1} * {operand2}',
-        'arithmetic_divide': '{result} = {operand1} / {operand2}',
-        'assignment': '{variable} = {value}',
-        'conditional_if': 'if {condition}:\n    {then_block}',
-        'conditional_if_else': 'if {condition}:\n    {then_block}\nelse:\n    {else_block}',
-        'loop_repeat': 'for _ in range({count}):\n    {body}',
-        'loop_for_each': 'for {item} in {collection}:\n    {body}',
-        'loop_while': 'while {condition}:\n    {body}',
-        'list_create': '{variable} = [{items}]',
-        'list_append': '{list_var}.append({item})',
-        'dict_create': '{variable} = {{{items}}}',
-        'string_create': '{variable} = "{value}"',
+    TEMPLATES = _TEMPLATES
+    
+    # generate_* method for each supported pattern type
+    _GENERATORS = {
+        PatternType.ARITHMETIC: 'generate_arithmetic',
+        PatternType.CONDITIONAL: 'generate_conditional',
+        PatternType.LOOP: 'generate_loop',
+        PatternType.DATA_OPERATION: 'generate_data_operation',
+        PatternType.ASSIGNMENT: 'generate_assignment',
     }
     
+    # Patterns whose generators emit template lines only, with no user-supplied
+    # blocks, so format_code would return their output unchanged
+    _CLEAN_PATTERNS = frozenset((
+        PatternType.ARITHMETIC,
+        PatternType.ASSIGNMENT,
+        PatternType.DATA_OPERATION,
+    ))
+    
     def __init__(self):
         self.warnings: List[str] = []
+        # Set by generators that already checked every substituted piece of a
+        # fixed template, so generate() can skip compiling the whole snippet
+        self._prevalidated = False
     
     def generate(self, parsed_sentence: ParsedSentence) -> TranslationResult:
         """Main method to generate Python code from parsed sentence"""
-        self.warnings = []
+        self.warnings.clear()
+        self._prevalidated = False
         
         try:
             if not parsed_sentence.is_valid():
-                return TranslationResult.create_error(
+                return _create_error(
                     "Invalid parsed sentence: no operations, conditions, or variables found",
                     parsed_sentence.original_text
                 )
             
-            if parsed_sentence.pattern_type == PatternType.ARITHMETIC:
-                code = self.generate_arithmetic(parsed_sentence)
-            elif parsed_sentence.pattern_type == PatternType.CONDITIONAL:
-                code = self.generate_conditional(parsed_sentence)
-            elif parsed_sentence.pattern_type == PatternType.LOOP:
-                code = self.generate_loop(parsed_sentence)
-            elif parsed_sentence.pattern_type == PatternType.DATA_OPERATION:
-                code = self.generate_data_operation(parsed_sentence)
-            elif parsed_sentence.pattern_type == PatternType.ASSIGNMENT:
-                code = self.generate_assignment(parsed_sentence)
-            else:
-                return TranslationResult.create_error(
+            generator_name = self._GENERATORS.get(parsed_sentence.pattern_type)
+            if generator_name is None:
+                return _create_error(
                     f"Unsupported pattern type: {parsed_sentence.pattern_type}",
                     parsed_sentence.original_text
                 )
             
-            formatted_code = self.format_code(code)
-            is_valid, error_msg = self.validate_syntax(formatted_code)
+            code = getattr(self, generator_name)(parsed_sentence)
+            
+            if parsed_sentence.pattern_type in self._CLEAN_PATTERNS:
+                formatted_code = code
+            else:
+                formatted_code = self.format_code(code)
+            
+            if self._prevalidated:
+                is_valid, error_msg = True, ""
+            else:
+                is_valid, error_msg = self.validate_syntax(formatted_code)
             
             if not is_valid:
-                return TranslationResult.create_error(
+                return _create_error(
                     f"Generated code has syntax error: {error_msg}",
                     parsed_sentence.original_text
                 )
             
-            result = TranslationResult.create_success(formatted_code, parsed_sentence.original_text)
+            result = _create_success(formatted_code, parsed_sentence.original_text)
             for warning in self.warnings:
                 result.add_warning(warning)
             
             return result
             
         except Exception as e:
-            return TranslationResult.create_error(
+            return _create_error(
                 f"Code generation failed: {str(e)}",
                 parsed_sentence.original_text
             )
     
+    def generate_many(self, parsed_sentences: List[ParsedSentence]) -> List[TranslationResult]:
+        """
+        Generate code for a list of parsed sentences, returning one result per input in order.
+
+        Preferred for scripts that translate whole files: the warnings list, the
+        dispatch table and the syntax-check cache are reused across the batch.
+        """
+        generate = self.generate
+        return [generate(parsed_sentence) for parsed_sentence in parsed_sentences]
+    
     def generate_arithmetic(self, parsed_sentence: ParsedSentence) -> str:
         """Generate Python code for arithmetic operations"""
         if not parsed_sentence.operations:
             raise ValueError("No operations found for arithmetic pattern")
         
-        code_lines = []
+        return '\n'.join(self._iter_arithmetic(parsed_sentence))
+    
+    def _iter_arithmetic(self, parsed_sentence: ParsedSentence) -> Iterator[str]:
+        """Yield one line per arithmetic operation, recording division warnings as it goes"""
+        templates = _ARITHMETIC_FNS
         
         for operation in parsed_sentence.operations:
             if not operation.is_arithmetic():
                 continue
             
-            if len(operation.operands) < 2:
-                raise ValueError(f"Arithmetic operation requires at least 2 operands, got {len(operation.operands)}")
+            operands = operation.operands
+            if len(operands) < 2:
+                raise ValueError(f"Arithmetic operation requires at least 2 operands, got {len(operands)}")
             
-            operand1 = operation.operands[0]
-            operand2 = operation.operands[1]
-            result = operation.result_variable or 'result'
+            operation_type = operation.operation_type
+            operand2 = operands[1]
             
-            template_key = f'arithmetic_{operation.operation_type}'
-            if template_key not in self.TEMPLATES:
-                raise ValueError(f"Unknown arithmetic operation: {operation.operation_type}")
+            template = templates.get(operation_type)
+            if template is None:
+                raise ValueError(f"Unknown arithmetic operation: {operation_type}")
             
-            template = self.TEMPLATES[template_key]
-            code = template.format(result=result, operand1=operand1, operand2=operand2)
-            code_lines.append(code)
+            yield template(operation.result_variable or 'result', operands[0], operand2)
             
-            if operation.operation_type == 'divide':
-                try:
-                    if float(operand2) == 0:
-                        self.warnings.append("Warning: Division by zero detected")
-                except (ValueError, TypeError):
-                    pass
-        
-        return '\n'.join(code_lines)
+            if operation_type == 'divide' and _is_zero_divisor(operand2):
+                self.warnings.append("Warning: Division by zero detected")
     
     def generate_conditional(self, parsed_sentence: ParsedSentence) -> str:
         """Generate Python code for conditional statements"""
@@ -126,11 +303,16 @@ class CodeGenerator:
         condition_text = self._format_condition(condition.condition_text)
         
         if else_block:
-            template = self.TEMPLATES['conditional_if_else']
-            code = template.format(condition=condition_text, then_block=then_block, else_block=else_block)
+            code = _TEMPLATE_FNS['conditional_if_else'](condition_text, then_block, else_block)
         else:
-            template = self.TEMPLATES['conditional_if']
-            code = template.format(condition=condition_text, then_block=then_block)
+            code = _TEMPLATE_FNS['conditional_if'](condition_text, then_block)
+        
+        # Every piece is checked, not short-circuited, so each one is marked seen
+        self._prevalidated = all([
+            _is_valid_condition(condition_text),
+            _is_valid_block_line(then_block),
+            not else_block or _is_valid_block_line(else_block),
+        ])
         
         return code
     
@@ -141,19 +323,17 @@ class CodeGenerator:
         
         if loop_type == 'repeat':
             count = parsed_sentence.metadata.get('count', '1')
-            template = self.TEMPLATES['loop_repeat']
-            code = template.format(count=count, body=body)
+            code = _TEMPLATE_FNS['loop_repeat'](count, body)
         elif loop_type == 'for_each':
             item = parsed_sentence.metadata.get('item', 'item')
             collection = parsed_sentence.metadata.get('collection', '[]')
-            template = self.TEMPLATES['loop_for_each']
-            code = template.format(item=item, collection=collection, body=body)
+            code = _TEMPLATE_FNS['loop_for_each'](item, collection, body)
         elif loop_type == 'while':
             if not parsed_sentence.conditions:
                 raise ValueError("While loop requires a condition")
             condition = self._format_condition(parsed_sentence.conditions[0].condition_text)
-            template = self.TEMPLATES['loop_while']
-            code = template.format(condition=condition, body=body)
+            code = _TEMPLATE_FNS['loop_while'](condition, body)
+            self._prevalidated = all([_is_valid_condition(condition), _is_valid_block_line(body)])
         else:
             raise ValueError(f"Unknown loop type: {loop_type}")
         
@@ -164,124 +344,107 @@ class CodeGenerator:
         if not parsed_sentence.operations:
             raise ValueError("No operations found for data operation pattern")
         
-        code_lines = []
+        return '\n'.join(self._iter_data_operation(parsed_sentence))
+    
+    def _iter_data_operation(self, parsed_sentence: ParsedSentence) -> Iterator[str]:
+        """Yield one line per data structure operation"""
+        templates = _TEMPLATE_FNS
+        data_type = parsed_sentence.metadata.get('data_type', 'list')
         
         for operation in parsed_sentence.operations:
-            if operation.operation_type == 'create':
-                data_type = parsed_sentence.metadata.get('data_type', 'list')
-                
+            operation_type = operation.operation_type
+            operands = operation.operands
+            
+            if operation_type == 'create':
                 if data_type == 'list':
-                    items = ', '.join(operation.operands)
-                    variable = operation.result_variable or 'my_list'
-                    template = self.TEMPLATES['list_create']
-                    code = template.format(variable=variable, items=items)
+                    yield templates['list_create'](operation.result_variable or 'my_list', ', '.join(operands))
                 elif data_type == 'dict':
-                    items = ', '.join(operation.operands)
-                    variable = operation.result_variable or 'my_dict'
-                    template = self.TEMPLATES['dict_create']
-                    code = template.format(variable=variable, items=items)
+                    yield templates['dict_create'](operation.result_variable or 'my_dict', ', '.join(operands))
                 elif data_type == 'string':
-                    value = operation.operands[0] if operation.operands else ''
-                    variable = operation.result_variable or 'my_string'
-                    template = self.TEMPLATES['string_create']
-                    code = template.format(variable=variable, value=value)
+                    value = operands[0] if operands else ''
+                    yield templates['string_create'](operation.result_variable or 'my_string', value)
                 else:
                     raise ValueError(f"Unknown data type: {data_type}")
-                
-                code_lines.append(code)
             
-            elif operation.operation_type == 'append':
-                if len(operation.operands) < 2:
+            elif operation_type == 'append':
+                if len(operands) < 2:
                     raise ValueError("Append operation requires list variable and item")
-                list_var = operation.operands[0]
-                item = operation.operands[1]
-                template = self.TEMPLATES['list_append']
-                code = template.format(list_var=list_var, item=item)
-                code_lines.append(code)
+                yield templates['list_append'](operands[0], operands[1])
             
             else:
-                code_lines.append(f"# {operation.operation_type} operation")
-        
-        return '\n'.join(code_lines)
+                yield f"# {operation_type} operation"
     
     def generate_assignment(self, parsed_sentence: ParsedSentence) -> str:
         """Generate Python code for assignment operations"""
-        code_lines = []
+        variables = parsed_sentence.variables
+        
+        # Most sentences assign exactly one variable: emit that line directly
+        if len(variables) == 1 and not parsed_sentence.operations:
+            (var_name, var_value), = variables.items()
+            return _TEMPLATE_FNS['assignment'](var_name, self._format_value(var_value))
+        
+        code = '\n'.join(self._iter_assignment(parsed_sentence))
+        
+        if not code:
+            raise ValueError("No assignments found")
+        
+        return code
+    
+    def _iter_assignment(self, parsed_sentence: ParsedSentence) -> Iterator[str]:
+        """Yield one line per variable and assignment operation"""
+        template = _TEMPLATE_FNS['assignment']
+        format_value = self._format_value
         
         for var_name, var_value in parsed_sentence.variables.items():
-            template = self.TEMPLATES['assignment']
-            
-            if isinstance(var_value, str):
-                formatted_value = f'"{var_value}"'
-            else:
-                formatted_value = str(var_value)
-            
-            code = template.format(variable=var_name, value=formatted_value)
-            code_lines.append(code)
+            yield template(var_name, format_value(var_value))
         
         for operation in parsed_sentence.operations:
             if operation.is_assignment():
                 if not operation.result_variable or not operation.operands:
                     continue
                 
-                template = self.TEMPLATES['assignment']
                 value = operation.operands[0] if operation.operands else 'None'
-                code = template.format(variable=operation.result_variable, value=value)
-                code_lines.append(code)
-        
-        if not code_lines:
-            raise ValueError("No assignments found")
-        
-        return '\n'.join(code_lines)
+                yield template(operation.result_variable, value)
+    
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """Render a variable value as a Python literal, quoting strings"""
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is None:
+            # Subclasses such as str-based enums still need quoting
+            formatter = _VALUE_FORMATTERS[str] if isinstance(value, str) else str
+        return formatter(value)
     
     def format_code(self, code: str) -> str:
-        """Format Python code with proper indentation and spacing"""
-        if not code.strip():
+        """
+        Format Python code with proper indentation and spacing.
+
+        Code that needs no changes is returned as the same object, so generate()
+        hands the template output straight to validate_syntax without a copy.
+        """
+        if not code or code.isspace():
             return code
         
         lines = code.split('\n')
-        formatted_lines = []
         
-        for line in lines:
-            if line.startswith('    ') or line.startswith('\t'):
-                formatted_lines.append(line)
-            else:
-                formatted_line = line.strip()
-                if formatted_line:
-                    formatted_lines.append(formatted_line)
+        # Template output is usually clean already: return it untouched unless
+        # some unindented line is blank or carries stray whitespace
+        if all(line.startswith(_INDENT_PREFIXES) or (line and line == line.strip()) for line in lines):
+            return code
         
-        return '\n'.join(formatted_lines)
+        return '\n'.join([
+            line if line.startswith(_INDENT_PREFIXES) else line.strip()
+            for line in lines
+            if line.startswith(_INDENT_PREFIXES) or line.strip()
+        ])
     
     def validate_syntax(self, code: str) -> Tuple[bool, str]:
-        """Validate Python code syntax using AST parser"""
-        if not code.strip():
+        """Validate Python code syntax by compiling it"""
+        if not code or code.isspace():
             return False, "Empty code"
         
-        try:
-            ast.parse(code)
-            return True, ""
-        except SyntaxError as e:
-            error_msg = f"Line {e.lineno}: {e.msg}"
-            return False, error_msg
-        except Exception as e:
-            return False, str(e)
+        return _validate_cached(code)
     
     def _format_condition(self, condition_text: str) -> str:
         """Format condition text to valid Python boolean expression"""
-        condition = condition_text.strip()
-        
-        replacements = {
-            ' equals ': ' == ',
-            ' is equal to ': ' == ',
-            ' is ': ' == ',
-            ' greater than ': ' > ',
-            ' less than ': ' < ',
-            ' and ': ' and ',
-            ' or ': ' or ',
-            ' not ': ' not ',
-        }
-        
-        for pattern, replacement in replacements.items():
-            condition = condition.replace(pattern, replacement)
-        
-        return condition
+        return _format_condition_cached(condition_text)
@@ -4,8 +4,8 @@ Menganalisis dan memparse kalimat bahasa Inggris menjadi struktur data
 """
 
 import re
-import nltk
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -44,132 +44,272 @@ class TokenType(Enum):
     KEYWORD = "keyword"
 
 
-@dataclass
+@dataclass(init=False)
 class Token:
     """Represents a token in the parsed sentence"""
+    # Hand-written slots (dataclass slots=True needs Python 3.10); the metadata
+    # default therefore lives in __init__ rather than on the class
+    __slots__ = ('text', 'token_type', 'position', 'metadata')
+    
     text: str
     token_type: TokenType
     position: int
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any]
+    
+    def __init__(self, text: str, token_type: TokenType, position: int,
+                 metadata: Optional[Dict[str, Any]] = None):
+        self.text = text
+        self.token_type = token_type
+        self.position = position
+        self.metadata = {} if metadata is None else metadata
+
+
+def _compile_patterns(patterns: List[Tuple[str, str]],
+                      flags: int) -> List[Tuple['re.Pattern[str]', str]]:
+    """Compile each (pattern, operation) pair, keeping list order"""
+    return [(re.compile(pattern, flags), operation) for pattern, operation in patterns]
+
+
+_ARITHMETIC_PATTERNS = [
+    # Division patterns (check first to avoid conflicts)
+    (r'\bdivide\s+(\w+)\s+by\s+(\w+)', 'divide'),
+    (r'\b(\w+)\s+divided\s+by\s+(\w+)', 'divide'),
+    (r'\b(?:split)\s+(\w+)\s+(?:by|with|/)\s+(\w+)', 'divide'),
+    (r'\b(\w+)\s*/\s*(\w+)', 'divide'),
+    (r'\bcalculate\s+(\w+)\s+divided\s+by\s+(\w+)', 'divide'),
+    
+    # Addition patterns
+    (r'\b(?:add|plus|sum)\s+(\w+)\s+(?:and|with|\+)\s+(\w+)', 'add'),
+    (r'\b(\w+)\s+plus\s+(\w+)', 'add'),
+    (r'\b(\w+)\s*\+\s*(\w+)', 'add'),
+    (r'\bcalculate\s+(\w+)\s+plus\s+(\w+)', 'add'),
+    (r'\bcalculate\s+(?:the\s+)?sum\s+of\s+(\w+)\s+and\s+(\w+)', 'add'),
     
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    # Subtraction patterns
+    (r'\b(?:subtract|minus)\s+(\w+)\s+(?:from|and)\s+(\w+)', 'subtract'),
+    (r'\b(\w+)\s+minus\s+(\w+)', 'subtract'),
+    (r'\b(\w+)\s*-\s*(\w+)', 'subtract'),
+    (r'\bcalculate\s+(\w+)\s+minus\s+(\w+)', 'subtract'),
+    
+    # Multiplication patterns (check after division to avoid conflicts)
+    (r'\bmultiply\s+(\w+)\s+(?:by|and|\*)\s+(\w+)', 'multiply'),
+    (r'\b(\w+)\s+times\s+(\w+)', 'multiply'),
+    (r'\b(\w+)\s*\*\s*(\w+)', 'multiply'),
+    (r'\bcalculate\s+(\w+)\s+times\s+(\w+)', 'multiply'),
+]
+
+_ASSIGNMENT_PATTERNS = [
+    (r'\bset\s+(\w+)\s+to\s+(.+)', 'assign'),
+    (r'\bcreate\s+variable\s+(\w+)\s+with\s+value\s+(.+)', 'assign'),
+    # More specific assignment pattern - avoid matching arithmetic expressions
+    (r'\b([a-zA-Z_]\w*)\s*=\s*([^+\-*/=<>!]+)', 'assign'),
+    (r'\bassign\s+(.+)\s+to\s+(\w+)', 'assign'),
+]
+
+_CONDITIONAL_PATTERNS = [
+    # Pattern with else clause - must come first
+    (r'\bif\s+(.+?)\s+then\s+(.+?)\s+else\s+(.+)$', 'conditional'),
+    # Pattern without else clause
+    (r'\bif\s+(.+?)\s+then\s+(.+)$', 'conditional'),
+    (r'\bwhen\s+(.+?)\s+then\s+(.+)$', 'conditional'),
+    (r'\bwhen\s+(.+?)\s+do\s+(.+)$', 'conditional'),
+    (r'\bunless\s+(.+?)\s+then\s+(.+)$', 'conditional'),
+]
+
+_LOOP_PATTERNS = [
+    (r'\brepeat\s+(\d+)\s+times?\s*:?\s*(.+)?', 'repeat'),
+    (r'\bloop\s+through\s+(\w+)', 'loop_through'),
+    (r'\bloop\s+(.+)', 'loop'),
+    (r'\bfor\s+each\s+(\w+)\s+in\s+(\w+)\s*:?\s*(.+)?', 'for_each'),
+    (r'\bwhile\s+(.+?)\s*:?\s*(.+)?', 'while'),
+]
+
+_DATA_OPERATION_PATTERNS = [
+    (r'\bcreate\s+(?:a\s+)?list(?:\s+with\s+(.+))?', 'create_list'),
+    (r'\bcreate\s+list(?:\s+with\s+(.+))?', 'create_list'),  # Handle "create list" without "a"
+    (r'\bmake\s+(?:a\s+)?list', 'create_list'),
+    (r'\bnew\s+list', 'create_list'),
+    (r'\bcreate\s+(?:a\s+)?(?:dictionary|dict)(?:\s+with\s+(.+))?', 'create_dict'),
+    (r'\bcreate\s+(?:dictionary|dict)(?:\s+with\s+(.+))?', 'create_dict'),  # Handle without "a"
+    (r'\bmake\s+(?:a\s+)?(?:dictionary|dict)', 'create_dict'),
+    (r'\bnew\s+(?:dictionary|dict)', 'create_dict'),
+    (r'\badd\s+(.+?)\s+(?:to|from)\s+(?:list\s+)?(\w+)', 'append_list'),
+    (r'\bremove\s+(.+?)\s+(?:from|to)\s+(?:list\s+)?(\w+)', 'remove_list'),
+    (r'\bget\s+(.+?)\s+from\s+(?:list\s+)?(\w+)', 'get_item'),
+]
+
+# Scanners used by InputParser.extract_variables. Numbers, quoted strings and
+# identifiers stay separate findall passes: words inside quotes are still
+# reported as names, and fusing them into one finditer loop measured slower.
+_NUMBER_LITERAL_RE = re.compile(r'\b(?:(?P<float>\d+\.\d+)|(?P<int>\d+))\b')
+_NUMBER_CONVERTERS: Dict[str, Callable[[str], Union[int, float]]] = {'float': float, 'int': int}
+_QUOTED_STRING_RE = re.compile(r'"([^"]*)"')
+_IDENTIFIER_RE = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+
+# Word sets used to classify tokens
+_KEYWORDS = frozenset({
+    'add', 'subtract', 'multiply', 'divide', 'plus', 'minus', 'times',
+    'if', 'then', 'else', 'when', 'do', 'while', 'for', 'each', 'in',
+    'repeat', 'create', 'set', 'assign', 'to', 'with', 'value',
+    'list', 'dictionary', 'dict', 'get', 'from', 'remove'
+})
+_CONDITION_WORDS = frozenset({'greater', 'less', 'equal', 'than', 'not'})
+_OPERATORS = frozenset({'+', '-', '*', '/', '=', '>', '<', '>=', '<=', '==', '!='})
+
+# Token type for every fixed word, so classification is one dict lookup
+_WORD_TO_TYPE = {
+    **dict.fromkeys(_OPERATORS, TokenType.OPERATOR),
+    **dict.fromkeys(_KEYWORDS, TokenType.KEYWORD),
+    **dict.fromkeys(_CONDITION_WORDS, TokenType.CONDITION),
+}
+
+# Splits a lowercased sentence into word, number and punctuation tokens
+_TOKEN_RE = re.compile(r'\b\w+\b|\d+|[^\w\s]')
+_TOKEN_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# Words extract_variables never reports as variable names
+_VARIABLE_KEYWORDS = _KEYWORDS | {'and', 'or'}
+
+# Words _extract_variables_from_condition never reports as variable names
+_CONDITION_KEYWORDS = frozenset({'and', 'or', 'not', 'is', 'than', 'equal', 'greater', 'less'})
+
+# Literal text every pattern of a category needs; identify_pattern skips a
+# category's regex when none of its triggers occurs in the sentence
+_CONDITIONAL_TRIGGERS = ('if', 'when', 'unless')
+_LOOP_TRIGGERS = ('repeat', 'loop', 'for', 'while')
+_DATA_OPERATION_TRIGGERS = ('create', 'make', 'new', 'add', 'remove', 'get')
+_ASSIGNMENT_TRIGGERS = ('set', 'create', '=', 'assign')
+_ARITHMETIC_TRIGGERS = ('divide', 'split', '/', 'add', 'plus', 'sum', '+',
+                        'subtract', 'minus', '-', 'multiply', 'times', '*')
+
+# Compiled once per process and shared by every PatternMatcher
+_ARITHMETIC_REGEXES = _compile_patterns(_ARITHMETIC_PATTERNS, re.IGNORECASE)
+_ASSIGNMENT_REGEXES = _compile_patterns(_ASSIGNMENT_PATTERNS, re.IGNORECASE)
+_CONDITIONAL_REGEXES = _compile_patterns(_CONDITIONAL_PATTERNS, re.IGNORECASE | re.DOTALL)
+_LOOP_REGEXES = _compile_patterns(_LOOP_PATTERNS, re.IGNORECASE | re.DOTALL)
+_DATA_OPERATION_REGEXES = _compile_patterns(_DATA_OPERATION_PATTERNS, re.IGNORECASE | re.DOTALL)
+
+
+def _has_trigger(text: str, triggers: Tuple[str, ...]) -> bool:
+    """Cheap substring prefilter run before a category's regex"""
+    for trigger in triggers:
+        if trigger in text:
+            return True
+    return False
 
 
 class PatternMatcher:
     """Handles pattern matching for different types of English constructs"""
     
-    def __init__(self):
-        self._arithmetic_patterns = [
-            # Division patterns (check first to avoid conflicts)
-            (r'\bdivide\s+(\w+)\s+by\s+(\w+)', 'divide'),
-            (r'\b(\w+)\s+divided\s+by\s+(\w+)', 'divide'),
-            (r'\b(?:split)\s+(\w+)\s+(?:by|with|/)\s+(\w+)', 'divide'),
-            (r'\b(\w+)\s*/\s*(\w+)', 'divide'),
-            (r'\bcalculate\s+(\w+)\s+divided\s+by\s+(\w+)', 'divide'),
-            
-            # Addition patterns
-            (r'\b(?:add|plus|sum)\s+(\w+)\s+(?:and|with|\+)\s+(\w+)', 'add'),
-            (r'\b(\w+)\s+plus\s+(\w+)', 'add'),
-            (r'\b(\w+)\s*\+\s*(\w+)', 'add'),
-            (r'\bcalculate\s+(\w+)\s+plus\s+(\w+)', 'add'),
-            (r'\bcalculate\s+(?:the\s+)?sum\s+of\s+(\w+)\s+and\s+(\w+)', 'add'),
-            
-            # Subtraction patterns
-            (r'\b(?:subtract|minus)\s+(\w+)\s+(?:from|and)\s+(\w+)', 'subtract'),
-            (r'\b(\w+)\s+minus\s+(\w+)', 'subtract'),
-            (r'\b(\w+)\s*-\s*(\w+)', 'subtract'),
-            (r'\bcalculate\s+(\w+)\s+minus\s+(\w+)', 'subtract'),
-            
-            # Multiplication patterns (check after division to avoid conflicts)
-            (r'\bmultiply\s+(\w+)\s+(?:by|and|\*)\s+(\w+)', 'multiply'),
-            (r'\b(\w+)\s+times\s+(\w+)', 'multiply'),
-            (r'\b(\w+)\s*\*\s*(\w+)', 'multiply'),
-            (r'\bcalculate\s+(\w+)\s+times\s+(\w+)', 'multiply'),
-        ]
-        
-        self._assignment_patterns = [
-            (r'\bset\s+(\w+)\s+to\s+(.+)', 'assign'),
-            (r'\bcreate\s+variable\s+(\w+)\s+with\s+value\s+(.+)', 'assign'),
-            # More specific assignment pattern - avoid matching arithmetic expressions
-            (r'\b([a-zA-Z_]\w*)\s*=\s*([^+\-*/=<>!]+)', 'assign'),
-            (r'\bassign\s+(.+)\s+to\s+(\w+)', 'assign'),
-        ]
-        
-        self._conditional_patterns = [
-            # Pattern with else clause - must come first
-            (r'\bif\s+(.+?)\s+then\s+(.+?)\s+else\s+(.+)$', 'conditional'),
-            # Pattern without else clause
-            (r'\bif\s+(.+?)\s+then\s+(.+)$', 'conditional'),
-            (r'\bwhen\s+(.+?)\s+then\s+(.+)$', 'conditional'),
-            (r'\bwhen\s+(.+?)\s+do\s+(.+)$', 'conditional'),
-            (r'\bunless\s+(.+?)\s+then\s+(.+)$', 'conditional'),
-        ]
-        
-        self._loop_patterns = [
-            (r'\brepeat\s+(\d+)\s+times?\s*:?\s*(.+)?', 'repeat'),
-            (r'\bloop\s+through\s+(\w+)', 'loop_through'),
-            (r'\bloop\s+(.+)', 'loop'),
-            (r'\bfor\s+each\s+(\w+)\s+in\s+(\w+)\s*:?\s*(.+)?', 'for_each'),
-            (r'\bwhile\s+(.+?)\s*:?\s*(.+)?', 'while'),
-        ]
-        
-        self._data_operation_patterns = [
-            (r'\bcreate\s+(?:a\s+)?list(?:\s+with\s+(.+))?', 'create_list'),
-            (r'\bcreate\s+list(?:\s+with\s+(.+))?', 'create_list'),  # Handle "create list" without "a"
-            (r'\bmake\s+(?:a\s+)?list', 'create_list'),
-            (r'\bnew\s+list', 'create_list'),
-            (r'\bcreate\s+(?:a\s+)?(?:dictionary|dict)(?:\s+with\s+(.+))?', 'create_dict'),
-            (r'\bcreate\s+(?:dictionary|dict)(?:\s+with\s+(.+))?', 'create_dict'),  # Handle without "a"
-            (r'\bmake\s+(?:a\s+)?(?:dictionary|dict)', 'create_dict'),
-            (r'\bnew\s+(?:dictionary|dict)', 'create_dict'),
-            (r'\badd\s+(.+?)\s+(?:to|from)\s+(?:list\s+)?(\w+)', 'append_list'),
-            (r'\bremove\s+(.+?)\s+(?:from|to)\s+(?:list\s+)?(\w+)', 'remove_list'),
-            (r'\bget\s+(.+?)\s+from\s+(?:list\s+)?(\w+)', 'get_item'),
-        ]
-    
     def match_arithmetic(self, text: str) -> Optional[Tuple[str, List[str]]]:
         """Match arithmetic patterns in text"""
-        for pattern, operation in self._arithmetic_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex, operation in _ARITHMETIC_REGEXES:
+            match = regex.search(text)
             if match:
                 return operation, list(match.groups())
         return None
     
     def match_assignment(self, text: str) -> Optional[Tuple[str, List[str]]]:
         """Match assignment patterns in text"""
-        for pattern, operation in self._assignment_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex, operation in _ASSIGNMENT_REGEXES:
+            match = regex.search(text)
             if match:
                 return operation, list(match.groups())
         return None
     
     def match_conditional(self, text: str) -> Optional[Tuple[str, List[str]]]:
         """Match conditional patterns in text"""
-        for pattern, operation in self._conditional_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for regex, operation in _CONDITIONAL_REGEXES:
+            match = regex.search(text)
             if match:
                 return operation, list(match.groups())
         return None
     
     def match_loop(self, text: str) -> Optional[Tuple[str, List[str]]]:
         """Match loop patterns in text"""
-        for pattern, operation in self._loop_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for regex, operation in _LOOP_REGEXES:
+            match = regex.search(text)
             if match:
                 return operation, list(match.groups())
         return None
     
     def match_data_operation(self, text: str) -> Optional[Tuple[str, List[str]]]:
         """Match data operation patterns in text"""
-        for pattern, operation in self._data_operation_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for regex, operation in _DATA_OPERATION_REGEXES:
+            match = regex.search(text)
             if match:
                 return operation, list(match.groups())
         return None
 
 
+# NLTK data the parser expects; setup_env.py downloads it
+_NLTK_RESOURCES = ('tokenizers/punkt', 'taggers/averaged_perceptron_tagger')
+
+
+@lru_cache(maxsize=None)
+def _has_nltk_data() -> bool:
+    """Whether NLTK and its tokenizer and tagger data are installed, checked once per process"""
+    # Imported here: parsing is regex based, so importing NLTK (slow) is only
+    # worth it for this optional data check
+    try:
+        import nltk
+    except ImportError:
+        return False
+    
+    try:
+        for resource in _NLTK_RESOURCES:
+            nltk.data.find(resource)
+    except LookupError:
+        return False
+    return True
+
+
+# PatternMatcher holds no state, so one instance serves the cached classifier
+_PATTERN_MATCHER = PatternMatcher()
+
+
+# Pattern categories in priority order with their trigger words and matchers:
+# conditionals first (they often contain other keywords), data operations
+# before assignment (to handle "add X to list Y") and arithmetic last (its
+# patterns are the broadest)
+_CLASSIFIERS = (
+    (PatternType.CONDITIONAL, _CONDITIONAL_TRIGGERS, _PATTERN_MATCHER.match_conditional),
+    (PatternType.LOOP, _LOOP_TRIGGERS, _PATTERN_MATCHER.match_loop),
+    (PatternType.DATA_OPERATION, _DATA_OPERATION_TRIGGERS, _PATTERN_MATCHER.match_data_operation),
+    (PatternType.ASSIGNMENT, _ASSIGNMENT_TRIGGERS, _PATTERN_MATCHER.match_assignment),
+    (PatternType.ARITHMETIC, _ARITHMETIC_TRIGGERS, _PATTERN_MATCHER.match_arithmetic),
+)
+
+
+@lru_cache(maxsize=1024)
+def _classify_sentence(sentence: str) -> Tuple[PatternType, Optional[Tuple[str, List[str]]]]:
+    """
+    Find the pattern type of a sentence and the match that decided it.
+
+    Cached per distinct text since inputs repeat a lot. Triggers are checked on
+    the lowercased text, while the case-insensitive regexes run on the original
+    so the captured parts keep their case for the _parse_* helpers. Callers must
+    not modify the returned parts list.
+    """
+    sentence_lower = sentence.lower()
+    for pattern_type, triggers, match in _CLASSIFIERS:
+        if _has_trigger(sentence_lower, triggers):
+            match_result = match(sentence)
+            if match_result:
+                return pattern_type, match_result
+    return PatternType.UNKNOWN, None
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(sentence: str) -> int:
+    """
+    Count tokens the way tokenize_input splits them, without building Token objects.
+
+    Cached alongside _classify_sentence so a repeated sentence is lowercased once.
+    """
+    return len(_TOKEN_RE.findall(sentence.lower()))
+
+
 class InputParser:
     """
     Main Input Parser class for analyzing and parsing English sentences
@@ -179,69 +319,31 @@ class InputParser:
         self.pattern_matcher = PatternMatcher()
         self._ensure_nltk_data()
     
-    def _ensure_nltk_data(self):
-        """Ensure required NLTK data is available"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            try:
-                nltk.download('punkt', quiet=True)
-            except Exception:
-                pass  # Continue without NLTK if download fails
-        
-        try:
-            nltk.data.find('taggers/averaged_perceptron_tagger')
-        except LookupError:
-            try:
-                nltk.download('averaged_perceptron_tagger', quiet=True)
-            except Exception:
-                pass  # Continue without NLTK if download fails
+    def _ensure_nltk_data(self) -> bool:
+        """Check that NLTK data is available; downloading it is left to setup_env.py"""
+        return _has_nltk_data()
     
     def tokenize_input(self, sentence: str) -> List[Token]:
         """
         Tokenize input sentence into meaningful tokens
         """
-        tokens = []
-        
         # Basic tokenization - split by whitespace and punctuation
-        words = re.findall(r'\b\w+\b|\d+|[^\w\s]', sentence.lower())
-        
-        for i, word in enumerate(words):
-            token_type = self._classify_token(word)
-            token = Token(
-                text=word,
-                token_type=token_type,
-                position=i
-            )
-            tokens.append(token)
+        words = _TOKEN_RE.findall(sentence.lower())
         
-        return tokens
+        classify = self._classify_token
+        return [Token(word, classify(word), i) for i, word in enumerate(words)]
     
     def _classify_token(self, word: str) -> TokenType:
         """Classify a word into a token type"""
+        # Operators, keywords and condition words
+        token_type = _WORD_TO_TYPE.get(word)
+        if token_type is not None:
+            return token_type
+        
         # Numbers
-        if re.match(r'^\d+(\.\d+)?$', word):
+        if _TOKEN_NUMBER_RE.fullmatch(word):
             return TokenType.NUMBER
         
-        # Operators
-        if word in ['+', '-', '*', '/', '=', '>', '<', '>=', '<=', '==', '!=']:
-            return TokenType.OPERATOR
-        
-        # Keywords
-        keywords = {
-            'add', 'subtract', 'multiply', 'divide', 'plus', 'minus', 'times',
-            'if', 'then', 'else', 'when', 'do', 'while', 'for', 'each', 'in',
-            'repeat', 'create', 'set', 'assign', 'to', 'with', 'value',
-            'list', 'dictionary', 'dict', 'get', 'from', 'remove'
-        }
-        if word in keywords:
-            return TokenType.KEYWORD
-        
-        # Conditions
-        condition_words = {'greater', 'less', 'equal', 'than', 'not'}
-        if word in condition_words:
-            return TokenType.CONDITION
-        
         # Variables (default for other words)
         return TokenType.VARIABLE
     
@@ -249,29 +351,7 @@ class InputParser:
         """
         Identify the main pattern type of the sentence
         """
-        sentence_lower = sentence.lower()
-        
-        # Check for conditional patterns first (they often contain other keywords)
-        if self.pattern_matcher.match_conditional(sentence_lower):
-            return PatternType.CONDITIONAL
-        
-        # Check for loop patterns
-        if self.pattern_matcher.match_loop(sentence_lower):
-            return PatternType.LOOP
-        
-        # Check for data operation patterns before assignment (to handle "add X to list Y")
-        if self.pattern_matcher.match_data_operation(sentence_lower):
-            return PatternType.DATA_OPERATION
-        
-        # Check for assignment patterns
-        if self.pattern_matcher.match_assignment(sentence_lower):
-            return PatternType.ASSIGNMENT
-        
-        # Check for arithmetic patterns last (they have broad patterns)
-        if self.pattern_matcher.match_arithmetic(sentence_lower):
-            return PatternType.ARITHMETIC
-        
-        return PatternType.UNKNOWN
+        return _classify_sentence(sentence)[0]
     
     def extract_variables(self, sentence: str, pattern_type: PatternType = None) -> Dict[str, Any]:
         """
@@ -285,63 +365,57 @@ class InputParser:
             return variables
         
         # Extract numbers as potential variable values
-        numbers = re.findall(r'\b\d+(?:\.\d+)?\b', sentence)
-        for i, num in enumerate(numbers):
-            if '.' in num:
-                variables[f'num_{i}'] = float(num)
-            else:
-                variables[f'num_{i}'] = int(num)
+        # The matching group names the constructor, so no second scan for '.'
+        for i, number in enumerate(_NUMBER_LITERAL_RE.finditer(sentence)):
+            kind = number.lastgroup  # always set: each alternative is a named group
+            if kind is not None:
+                variables[f'num_{i}'] = _NUMBER_CONVERTERS[kind](number.group(kind))
         
         # Extract quoted strings as potential values
-        strings = re.findall(r'"([^"]*)"', sentence)
+        strings = _QUOTED_STRING_RE.findall(sentence)
         for i, string in enumerate(strings):
             variables[f'str_{i}'] = string
         
         # Extract variable names (words that look like identifiers)
-        var_names = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', sentence)
-        keywords = {
-            'add', 'subtract', 'multiply', 'divide', 'plus', 'minus', 'times',
-            'if', 'then', 'else', 'when', 'do', 'while', 'for', 'each', 'in',
-            'repeat', 'create', 'set', 'assign', 'to', 'with', 'value',
-            'list', 'dictionary', 'dict', 'get', 'from', 'remove', 'and', 'or'
-        }
+        var_names = _IDENTIFIER_RE.findall(sentence)
         
         for name in var_names:
-            if name.lower() not in keywords and len(name) >= 1:  # Allow single character variables
+            if name.lower() not in _VARIABLE_KEYWORDS:  # Single character variables are allowed
                 if name not in variables:
                     variables[name] = None  # Variable exists but value unknown
         
         return variables
     
-    def _parse_arithmetic_operation(self, sentence: str) -> List[Operation]:
+    def _parse_arithmetic_operation(self, sentence: str,
+                                    match_result: Optional[Tuple[str, List[str]]] = None) -> List[Operation]:
         """Parse arithmetic operations from sentence"""
         operations = []
-        match_result = self.pattern_matcher.match_arithmetic(sentence)
+        if match_result is None:
+            match_result = self.pattern_matcher.match_arithmetic(sentence)
         
         if match_result:
             operation_type, operands = match_result
             
-            # Clean operands
-            cleaned_operands = []
-            for operand in operands:
-                operand = operand.strip()
-                if operand:
-                    cleaned_operands.append(operand)
+            # Clean operands into a fresh list; the matched parts are shared by the cache
+            cleaned_operands = [operand for operand in map(str.strip, operands) if operand]
             
             if len(cleaned_operands) >= 2:
+                del cleaned_operands[2:]
                 operation = Operation(
                     operation_type=operation_type,
-                    operands=cleaned_operands[:2],
+                    operands=cleaned_operands,
                     result_variable="result"
                 )
                 operations.append(operation)
         
         return operations
     
-    def _parse_assignment_operation(self, sentence: str) -> List[Operation]:
+    def _parse_assignment_operation(self, sentence: str,
+                                    match_result: Optional[Tuple[str, List[str]]] = None) -> List[Operation]:
         """Parse assignment operations from sentence"""
         operations = []
-        match_result = self.pattern_matcher.match_assignment(sentence)
+        if match_result is None:
+            match_result = self.pattern_matcher.match_assignment(sentence)
         
         if match_result:
             operation_type, parts = match_result
@@ -362,10 +436,12 @@ class InputParser:
         
         return operations
     
-    def _parse_data_operation(self, sentence: str) -> List[Operation]:
+    def _parse_data_operation(self, sentence: str,
+                              match_result: Optional[Tuple[str, List[str]]] = None) -> List[Operation]:
         """Parse data structure operations from sentence"""
         operations = []
-        match_result = self.pattern_matcher.match_data_operation(sentence)
+        if match_result is None:
+            match_result = self.pattern_matcher.match_data_operation(sentence)
         
         if match_result:
             operation_type, parts = match_result
@@ -401,10 +477,12 @@ class InputParser:
         
         return operations
     
-    def _parse_conditions(self, sentence: str) -> List[Condition]:
+    def _parse_conditions(self, sentence: str,
+                          match_result: Optional[Tuple[str, List[str]]] = None) -> List[Condition]:
         """Parse conditional statements from sentence"""
         conditions = []
-        match_result = self.pattern_matcher.match_conditional(sentence)
+        if match_result is None:
+            match_result = self.pattern_matcher.match_conditional(sentence)
         
         if match_result:
             condition_type, parts = match_result
@@ -424,66 +502,70 @@ class InputParser:
     
     def _extract_variables_from_condition(self, condition_text: str) -> List[str]:
         """Extract variable names from condition text"""
-        variables = []
-        var_names = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', condition_text)
-        
-        keywords = {'and', 'or', 'not', 'is', 'than', 'equal', 'greater', 'less'}
-        for name in var_names:
-            if name.lower() not in keywords:
-                variables.append(name)
-        
-        return variables
+        return [
+            name for name in _IDENTIFIER_RE.findall(condition_text)
+            if name.lower() not in _CONDITION_KEYWORDS
+        ]
+    
+    # Keywords that are always printed as string literals
+    _PRINT_STRING_KEYWORDS = frozenset([
+        'pass', 'fail', 'true', 'false', 'none', 'adult', 'minor',
+        'hot', 'cold', 'normal', 'excellent', 'good', 'poor', 'empty',
+        'running', 'stopped', 'active', 'inactive', 'high_score',
+        'normal_score', 'level_up', 'continue_playing', 'game_over',
+        'still_alive', 'bonus_life', 'humid', 'windy', 'calm',
+        'extreme_heat', 'danger', 'safe', 'very_hot', 'good_math',
+        'poor_math', 'need_improvement', 'excellent_english',
+        'good_english', 'passed', 'failed', 'member_discount',
+        'no_discount', 'bulk_discount', 'regular_price', 'expensive',
+        'affordable', 'twenty_years_old', 'twenty', 'old', 'young',
+    ])
+    
+    # Substrings that mark a printed word as a variable reference
+    _COMMON_VARIABLE_NAMES = ('age', 'score', 'temperature', 'humidity', 'count',
+                              'total', 'result', 'status', 'level', 'lives', 'name')
     
     def _format_action(self, action_text: str) -> str:
         """Format action text to valid Python code that can be executed"""
         action = action_text.strip()
         
-        # Handle print statements
-        if action.lower().startswith('print '):
-            # Extract what to print
-            print_content = action[6:].strip()  # Remove 'print '
-            
-            # Handle special keywords that should be treated as strings
-            special_keywords = ['pass', 'fail', 'true', 'false', 'none', 'adult', 'minor', 
-                              'hot', 'cold', 'normal', 'excellent', 'good', 'poor', 'empty',
-                              'running', 'stopped', 'active', 'inactive', 'high_score', 
-                              'normal_score', 'level_up', 'continue_playing', 'game_over',
-                              'still_alive', 'bonus_life', 'humid', 'windy', 'calm',
-                              'extreme_heat', 'danger', 'safe', 'very_hot', 'good_math',
-                              'poor_math', 'need_improvement', 'excellent_english', 
-                              'good_english', 'passed', 'failed', 'member_discount',
-                              'no_discount', 'bulk_discount', 'regular_price', 'expensive',
-                              'affordable', 'twenty_years_old', 'twenty', 'old', 'young']
-            
-            # Check if it's a special keyword or common output that should be a string
-            if (print_content.lower() in special_keywords or 
-                not print_content.isidentifier() or
-                print_content.lower() in ['pass', 'fail']):
-                return f'print("{print_content}")'
-            else:
-                # Check if it looks like a variable that might not be defined
-                # For safety, treat most single words as strings unless they're clearly variables
-                if print_content.isidentifier() and len(print_content) > 2:
-                    # Check if it's a common variable name pattern
-                    common_vars = ['age', 'score', 'temperature', 'humidity', 'count', 
-                                 'total', 'result', 'status', 'level', 'lives', 'name']
-                    if any(var in print_content.lower() for var in common_vars):
-                        return f'print({print_content})'
-                    else:
-                        # Treat as string to avoid NameError
-                        return f'print("{print_content}")'
-                else:
-                    # Treat as string literal
-                    return f'print("{print_content}")'
-        
-        # Handle other common actions
-        elif action.lower().startswith('set '):
-            # Handle assignment within conditional
-            return action  # Let assignment parser handle this
+        # Dispatch on the leading keyword instead of testing each prefix in turn
+        keyword, separator, rest = action.partition(' ')
+        if separator:
+            handler = self._ACTION_HANDLERS.get(keyword.lower())
+            if handler is not None:
+                return handler(self, action, rest.strip())
         
         # Default: return as comment if we can't parse it
         return f'# {action}'
     
+    def _format_print_action(self, action: str, print_content: str) -> str:
+        """Format a 'print ...' action as a print() call"""
+        # Check if it's a special keyword or common output that should be a string
+        if (print_content.lower() in self._PRINT_STRING_KEYWORDS or
+            not print_content.isidentifier()):
+            return f'print("{print_content}")'
+        
+        # Check if it looks like a variable that might not be defined
+        # For safety, treat most single words as strings unless they're clearly variables
+        if len(print_content) > 2:
+            print_lower = print_content.lower()
+            if any(var in print_lower for var in self._COMMON_VARIABLE_NAMES):
+                return f'print({print_content})'
+        
+        # Treat as string literal to avoid NameError
+        return f'print("{print_content}")'
+    
+    def _format_set_action(self, action: str, value_text: str) -> str:
+        """Format a 'set ...' action inside a conditional"""
+        return action  # Let assignment parser handle this
+    
+    # Leading keyword -> action formatter
+    _ACTION_HANDLERS = {
+        'print': _format_print_action,
+        'set': _format_set_action,
+    }
+    
     def _format_assignment_value(self, value: str) -> str:
         """Format assignment value to proper Python syntax"""
         value = value.strip()
@@ -523,42 +605,34 @@ class InputParser:
         if not sentence or not sentence.strip():
             raise ValueError("Input sentence cannot be empty")
         
+        # The match that decided the pattern type is reused by the _parse_* helpers
+        pattern_type, pattern_match = _classify_sentence(sentence)
+        
         # Create parsed sentence object
         parsed = ParsedSentence(
             original_text=sentence.strip(),
-            pattern_type=self.identify_pattern(sentence)
+            pattern_type=pattern_type
         )
         
         # Extract variables
-        variables = self.extract_variables(sentence, parsed.pattern_type)
-        for name, value in variables.items():
-            parsed.add_variable(name, value)
+        parsed.add_variables(self.extract_variables(sentence, parsed.pattern_type))
         
         # Parse operations based on pattern type
         if parsed.pattern_type == PatternType.ARITHMETIC:
-            operations = self._parse_arithmetic_operation(sentence)
-            for op in operations:
-                parsed.add_operation(op)
+            parsed.add_operations(self._parse_arithmetic_operation(sentence, pattern_match))
         
         elif parsed.pattern_type == PatternType.ASSIGNMENT:
-            operations = self._parse_assignment_operation(sentence)
-            for op in operations:
-                parsed.add_operation(op)
+            parsed.add_operations(self._parse_assignment_operation(sentence, pattern_match))
         
         elif parsed.pattern_type == PatternType.DATA_OPERATION:
-            operations = self._parse_data_operation(sentence)
-            for op in operations:
-                parsed.add_operation(op)
+            parsed.add_operations(self._parse_data_operation(sentence, pattern_match))
         
         elif parsed.pattern_type == PatternType.CONDITIONAL:
-            conditions = self._parse_conditions(sentence)
-            for cond in conditions:
-                parsed.add_condition(cond)
+            parsed.add_conditions(self._parse_conditions(sentence, pattern_match))
             
-            # Extract action parts from conditional statement
-            match_result = self.pattern_matcher.match_conditional(sentence)
-            if match_result:
-                condition_type, parts = match_result
+            # Extract action parts from the match that classified the sentence
+            if pattern_match:
+                condition_type, parts = pattern_match
                 if len(parts) >= 2 and parts[1]:
                     # Extract then_block action
                     then_action = parts[1].strip()
@@ -570,11 +644,18 @@ class InputParser:
                     parsed.metadata['else_block'] = self._format_action(else_action)
         
         # Add metadata
-        parsed.metadata['tokens'] = len(self.tokenize_input(sentence))
+        parsed.metadata['tokens'] = _count_tokens(sentence)
         parsed.metadata['confidence'] = self._calculate_confidence(parsed)
         
         return parsed
     
+    def parse_many(self, sentences: List[str]) -> List[ParsedSentence]:
+        """
+        Parse a list of English sentences, returning one ParsedSentence per input in order
+        """
+        parse = self.parse_sentence
+        return [parse(sentence) for sentence in sentences]
+    
     def _calculate_confidence(self, parsed: ParsedSentence) -> float:
         """Calculate confidence score for the parsing result"""
         confidence = 0.0
@@ -596,6 +677,18 @@ class InputParser:
         
         return min(confidence, 1.0)
     
+    MAX_INPUT_LENGTH = 1000
+    
+    # Potentially dangerous content, combined into one case-insensitive scan
+    _DANGEROUS_CONTENT_RE = re.compile(
+        r'\bimport\s+os\b'
+        r'|\bexec\b'  # Match exec with or without parentheses
+        r'|\beval\b'  # Match eval with or without parentheses
+        r'|\b__.*__\b'
+        r'|\bopen\s*\(',
+        re.IGNORECASE
+    )
+    
     def validate_input(self, sentence: str) -> Tuple[bool, str]:
         """
         Validate input sentence for basic requirements
@@ -603,26 +696,19 @@ class InputParser:
         if not sentence:
             return False, "Input cannot be empty"
         
-        if not sentence.strip():
+        # Length is checked before any scan of the text
+        if len(sentence) > self.MAX_INPUT_LENGTH:
+            return False, f"Input too long (max {self.MAX_INPUT_LENGTH} characters)"
+        
+        stripped = sentence.strip()
+        if not stripped:
             return False, "Input cannot be only whitespace"
         
-        if len(sentence.strip()) < 3:
+        if len(stripped) < 3:
             return False, "Input too short to be meaningful"
         
-        if len(sentence) > 1000:
-            return False, "Input too long (max 1000 characters)"
-        
         # Check for potentially dangerous content
-        dangerous_patterns = [
-            r'\bimport\s+os\b',
-            r'\bexec\b',  # Match exec with or without parentheses
-            r'\beval\b',  # Match eval with or without parentheses
-            r'\b__.*__\b',
-            r'\bopen\s*\(',
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                return False, "Input contains potentially unsafe content"
+        if self._DANGEROUS_CONTENT_RE.search(sentence):
+            return False, "Input contains potentially unsafe content"
         
         return True, "Input is valid"
\ No newline at end of file
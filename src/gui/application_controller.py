@@ -8,13 +8,17 @@ Coordinates between GUI interface and backend services:
 """
 
 import tkinter as tk
+import tkinter.simpledialog as simpledialog
+from collections import OrderedDict
 from typing import Optional
+import codecs
 import os
 
 try:
     from .main_window import MainWindow
     from ..services.translation_engine import TranslationEngine
     from ..services.code_execution_service import CodeExecutionService, ExecutionConfig
+    from ..models.translation_result import TranslationResult, ExecutionResult
 except (ImportError, ValueError):
     # Fallback for when running tests or direct imports
     import sys
@@ -30,16 +34,51 @@ except (ImportError, ValueError):
         from gui.main_window import MainWindow
         from services.translation_engine import TranslationEngine
         from services.code_execution_service import CodeExecutionService, ExecutionConfig
+        from models.translation_result import TranslationResult, ExecutionResult  # type: ignore[import-not-found,no-redef]
     except ImportError:
         # Last resort - try absolute imports
         import src.gui.main_window as mw
         import src.services.translation_engine as te
         import src.services.code_execution_service as ces
+        import src.models.translation_result as tr
         
         MainWindow = mw.MainWindow
         TranslationEngine = te.TranslationEngine
         CodeExecutionService = ces.CodeExecutionService
         ExecutionConfig = ces.ExecutionConfig
+        TranslationResult = tr.TranslationResult  # type: ignore[misc]
+        ExecutionResult = tr.ExecutionResult  # type: ignore[misc]
+
+
+# Byte order marks _handle_load honours before falling back to UTF-8
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# _handle_load accepts at most this many characters of text. No file holding
+# that much can take more than four bytes per character plus a UTF-8 BOM, so
+# anything bigger on disk is rejected before it is read.
+_MAX_LOAD_CHARS = 100000
+_MAX_LOAD_BYTES = 4 * _MAX_LOAD_CHARS + len(codecs.BOM_UTF8)
+
+# Number of recent translations _handle_translate keeps for repeated input
+_TRANSLATION_CACHE_SIZE = 256
+
+# Shown in the input area when the application starts
+_WELCOME_MESSAGE = ("Welcome to English to Python Translator!\n\n"
+                    "Enter English instructions like:\n"
+                    "• add 5 and 3\n"
+                    "• set x to 10\n"
+                    "• create list with 1, 2, 3\n"
+                    "• if x greater than 5 then print yes\n\n"
+                    "Then click 'Translate' to generate Python code.")
+
+# Headers that open the formatted _handle_run output
+_RUN_SUCCESS_HEADER = "=== Execution Successful ==="
+_RUN_FAILURE_HEADER = "=== Execution Failed ==="
+_RUN_ERROR_HEADER = "=== Execution Error ==="
 
 
 class ApplicationController:
@@ -51,6 +90,11 @@ class ApplicationController:
         """Initialize the application controller"""
         # Initialize backend services
         self.translation_engine = TranslationEngine()
+        # The supported pattern list is fixed, so count it once for status queries
+        self._supported_patterns_count = len(self.translation_engine.get_supported_patterns())
+        # Translation is deterministic, so re-translating the same text reuses
+        # the earlier result (least recently used entries are dropped first)
+        self._translation_cache: 'OrderedDict[str, TranslationResult]' = OrderedDict()
         self.execution_service = CodeExecutionService(ExecutionConfig(
             timeout_seconds=30.0,
             allow_imports=False,
@@ -85,7 +129,15 @@ class ApplicationController:
             # Update status to show translation is in progress
             self.main_window.set_status("Translating...")
             
-            result = self.translation_engine.translate(english_text)
+            cache = self._translation_cache
+            result = cache.get(english_text)
+            if result is None:
+                result = self.translation_engine.translate(english_text)
+                cache[english_text] = result
+                if len(cache) > _TRANSLATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(english_text)
             
             # Update status based on result
             if result.success:
@@ -98,7 +150,6 @@ class ApplicationController:
         except Exception as e:
             # Create error result for unexpected exceptions
             self.main_window.set_status("Translation error occurred")
-            from ..models.translation_result import TranslationResult
             return TranslationResult.create_error(
                 f"Unexpected translation error: {str(e)}",
                 english_text,
@@ -122,7 +173,6 @@ class ApplicationController:
             # Set up input handler for interactive code
             def input_handler(prompt: str) -> str:
                 # Use tkinter's simpledialog for user input
-                import tkinter.simpledialog as simpledialog
                 user_input = simpledialog.askstring("Input Required", prompt)
                 return user_input if user_input is not None else ""
             
@@ -131,42 +181,33 @@ class ApplicationController:
             
             # Format the results for display
             if result.success:
-                output_parts = ["=== Execution Successful ==="]
                 if result.stdout:
-                    output_parts.append("Output:")
-                    output_parts.append(result.stdout)
+                    output = f"{_RUN_SUCCESS_HEADER}\nOutput:\n{result.stdout}"
                 else:
-                    output_parts.append("(No output produced)")
+                    output = f"{_RUN_SUCCESS_HEADER}\n(No output produced)"
                 
                 # Add execution time
-                output_parts.append(f"\nExecution time: {result.execution_time:.3f} seconds")
+                output += f"\n\nExecution time: {result.execution_time:.3f} seconds"
                 
                 # Add warnings if any
                 warnings = self.execution_service.get_execution_warnings(python_code)
                 if warnings:
-                    output_parts.append("\nWarnings:")
-                    for warning in warnings:
-                        output_parts.append(f"- {warning}")
+                    output += "\n\nWarnings:\n" + "\n".join(f"- {warning}" for warning in warnings)
                 
                 # Update the result with formatted output
-                result.output = "\n".join(output_parts)
+                result.output = output
                 
                 # Update status
                 self.main_window.set_status("Code executed successfully")
             else:
-                error_parts = ["=== Execution Failed ==="]
+                error_message = _RUN_FAILURE_HEADER
                 if result.error_message:
-                    error_parts.append("Error:")
-                    error_parts.append(result.error_message)
+                    error_message += f"\nError:\n{result.error_message}"
                 if result.stderr:
-                    error_parts.append("Error Details:")
-                    error_parts.append(result.stderr)
+                    error_message += f"\nError Details:\n{result.stderr}"
                 
-                # Add execution time
-                error_parts.append(f"\nExecution time: {result.execution_time:.3f} seconds")
-                
-                # Update the result with formatted error message
-                result.error_message = "\n".join(error_parts)
+                # Update the result with formatted error message, including execution time
+                result.error_message = f"{error_message}\n\nExecution time: {result.execution_time:.3f} seconds"
                 
                 # Update status
                 self.main_window.set_status("Code execution failed")
@@ -176,11 +217,10 @@ class ApplicationController:
         except Exception as e:
             # Create error result for unexpected exceptions
             self.main_window.set_status("Execution error occurred")
-            from ..models.translation_result import ExecutionResult
             return ExecutionResult(
                 success=False,
                 output="",
-                error_message=f"=== Execution Error ===\nUnexpected error: {str(e)}",
+                error_message=f"{_RUN_ERROR_HEADER}\nUnexpected error: {str(e)}",
                 execution_time=0.0
             )
     
@@ -203,30 +243,27 @@ class ApplicationController:
             if not file_path.lower().endswith('.py'):
                 file_path += '.py'
             
-            # Create directory if it doesn't exist
+            # Create directory if it doesn't exist (exist_ok covers the usual case
+            # without a separate exists() stat)
             directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
+            if directory:
                 os.makedirs(directory, exist_ok=True)
             
-            # Write the Python code to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(code)
-            
-            # Verify the file was written correctly
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    saved_content = f.read()
-                if saved_content == code:
-                    self.main_window.set_status(f"File saved successfully: {os.path.basename(file_path)}")
-                    return True
-                else:
-                    self.main_window.show_error("File was saved but content verification failed")
-                    self.main_window.set_status("Save failed - verification error")
-                    return False
-            else:
-                self.main_window.show_error("File was not created successfully")
-                self.main_window.set_status("Save failed - file not created")
-                return False
+            # Encode up front and hand the bytes to a binary file in one write,
+            # keeping the newline translation text mode would have applied
+            if os.linesep != '\n':
+                code = code.replace('\n', os.linesep)
+            data = code.encode('utf-8')
+            
+            # Write the Python code to file; a failed write or fsync raises, so
+            # the content does not need to be read back afterwards
+            with open(file_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            self.main_window.set_status(f"File saved successfully: {os.path.basename(file_path)}")
+            return True
                 
         except PermissionError:
             self.main_window.show_error(f"Permission denied: Cannot write to {file_path}")
@@ -266,27 +303,17 @@ class ApplicationController:
             if not os.path.isfile(file_path):
                 raise Exception(f"Path is not a file: {file_path}")
             
-            # Try to read the file with UTF-8 encoding first
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # If UTF-8 fails, try with other common encodings
-                encodings = ['latin-1', 'cp1252', 'iso-8859-1']
-                content = None
-                for encoding in encodings:
-                    try:
-                        with open(file_path, 'r', encoding=encoding) as f:
-                            content = f.read()
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if content is None:
-                    raise Exception("Unable to decode file with any supported encoding")
+            # Reject files that cannot fit the limit before reading them
+            if os.stat(file_path).st_size > _MAX_LOAD_BYTES:
+                raise Exception("File is too large (maximum 100KB for text input)")
+            
+            # Read the bytes once and decode them in memory rather than
+            # reopening the file for every candidate encoding
+            with open(file_path, 'rb') as f:
+                content = self._decode_text(f.read())
             
             # Validate that the content is reasonable for English text input
-            if len(content) > 100000:  # 100KB limit for text files
+            if len(content) > _MAX_LOAD_CHARS:  # 100KB limit for text files
                 raise Exception("File is too large (maximum 100KB for text input)")
             
             # Update status on successful load
@@ -308,6 +335,33 @@ class ApplicationController:
                 self.main_window.set_status("Load failed - unexpected error")
                 raise Exception(f"Failed to load file: {str(e)}")
     
+    @staticmethod
+    def _decode_text(raw: bytes) -> str:
+        """
+        Decode loaded file bytes the way a text-mode read would
+        
+        Args:
+            raw: File content as read from disk
+            
+        Returns:
+            Decoded text with universal newlines applied
+        """
+        encoding = 'utf-8'
+        for bom, bom_encoding in _BYTE_ORDER_MARKS:
+            if raw.startswith(bom):
+                encoding = bom_encoding
+                break
+        
+        try:
+            content = raw.decode(encoding)
+        except UnicodeDecodeError:
+            # Latin-1 maps every byte, so this fallback always succeeds
+            content = raw.decode('latin-1')
+        
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def run(self):
         """Start the application"""
         try:
@@ -347,15 +401,7 @@ class ApplicationController:
             self.main_window.clear_all()
             
             # Show welcome message in the input area
-            welcome_message = ("Welcome to English to Python Translator!\n\n"
-                             "Enter English instructions like:\n"
-                             "• add 5 and 3\n"
-                             "• set x to 10\n"
-                             "• create list with 1, 2, 3\n"
-                             "• if x greater than 5 then print yes\n\n"
-                             "Then click 'Translate' to generate Python code.")
-            
-            self.main_window.set_input_text(welcome_message)
+            self.main_window.set_input_text(_WELCOME_MESSAGE)
             
         except Exception as e:
             self.main_window.show_error(f"Startup error: {str(e)}")
@@ -388,5 +434,5 @@ class ApplicationController:
             "translation_engine_ready": self.translation_engine is not None,
             "execution_service_ready": self.execution_service is not None,
             "gui_ready": self.main_window is not None,
-            "supported_patterns": len(self.translation_engine.get_supported_patterns()) if self.translation_engine else 0
+            "supported_patterns": self._supported_patterns_count if self.translation_engine else 0
         }
\ No newline at end of file
@@ -2,7 +2,7 @@
 ParsedSentence data model for English to Python Translator
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -99,6 +99,26 @@ class ParsedSentence:
             raise TypeError("Expected Condition instance")
         self.conditions.append(condition)
     
+    def add_variables(self, variables: Dict[str, Any]) -> None:
+        """Add several variables to the parsed sentence at once"""
+        if any(not name.strip() for name in variables):
+            raise ValueError("Variable name cannot be empty")
+        self.variables.update(variables)
+    
+    def add_operations(self, operations: Iterable[Operation]) -> None:
+        """Add several operations to the parsed sentence at once"""
+        operations = list(operations)
+        if not all(isinstance(operation, Operation) for operation in operations):
+            raise TypeError("Expected Operation instance")
+        self.operations.extend(operations)
+    
+    def add_conditions(self, conditions: Iterable[Condition]) -> None:
+        """Add several conditions to the parsed sentence at once"""
+        conditions = list(conditions)
+        if not all(isinstance(condition, Condition) for condition in conditions):
+            raise TypeError("Expected Condition instance")
+        self.conditions.extend(conditions)
+    
     def get_variable_names(self) -> List[str]:
         """Get list of all variable names in the sentence"""
         return list(self.variables.keys())
@@ -2,7 +2,7 @@
 TranslationResult data model for English to Python Translator
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -113,12 +113,24 @@ class TranslationResult:
         critical_keywords = ['SyntaxError', 'IndentationError', 'NameError']
         return any(keyword in self.error_message for keyword in critical_keywords)
     
+    @property
+    def python_code_lines(self) -> Tuple[str, ...]:
+        """
+        Get the generated Python code split into lines.
+        The split is computed once and reused until python_code is reassigned.
+        """
+        cached = self.__dict__.get('_python_code_lines')
+        if cached is None or cached[0] is not self.python_code:
+            cached = (self.python_code, tuple(self.python_code.split('\n')))
+            self.__dict__['_python_code_lines'] = cached
+        return cached[1]
+    
     def get_formatted_code(self) -> str:
         """Get formatted Python code with proper indentation"""
         if not self.python_code:
             return ""
         
-        lines = self.python_code.split('\n')
+        lines = self.python_code_lines
         formatted_lines = []
         
         for line in lines:
@@ -5,6 +5,7 @@ This service provides safe execution of generated Python code with resource limi
 output capture, error handling, and user input support.
 """
 
+import asyncio
 import sys
 import io
 import time
@@ -13,13 +14,46 @@ import signal
 import subprocess
 import tempfile
 import os
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, AsyncIterator, Tuple
 from contextlib import contextmanager, redirect_stdout, redirect_stderr
 from dataclasses import dataclass
 
 from src.models.translation_result import ExecutionResult
 
 
+# Builtins available to executed code, in process and in the streaming child
+_SAFE_BUILTINS = frozenset({
+    # Basic types and functions
+    'abs', 'all', 'any', 'bin', 'bool', 'chr', 'dict', 'dir',
+    'divmod', 'enumerate', 'filter', 'float', 'format', 'frozenset',
+    'getattr', 'hasattr', 'hash', 'hex', 'id', 'int', 'isinstance',
+    'issubclass', 'iter', 'len', 'list', 'map', 'max', 'min',
+    'next', 'oct', 'ord', 'pow', 'print', 'range', 'repr',
+    'reversed', 'round', 'set', 'setattr', 'slice', 'sorted',
+    'str', 'sum', 'tuple', 'type', 'zip',
+    # Math operations
+    'divmod', 'pow', 'round',
+    # String operations
+    'chr', 'ord', 'str',
+    # Container operations
+    'len', 'list', 'dict', 'set', 'tuple',
+})
+
+# Run by the streaming child: reads the code from stdin and executes it with
+# the same restricted builtins as execute_code. input() is refused since the
+# child has no way to reach the configured input handler.
+_STREAMING_BOOTSTRAP = """
+import builtins, sys
+names = sys.argv[1].split(',')
+code = sys.stdin.buffer.read().decode()
+def refuse_input(prompt=''):
+    raise RuntimeError('Interactive input not supported in this context')
+safe_builtins = {name: getattr(builtins, name) for name in names if hasattr(builtins, name)}
+safe_builtins['input'] = refuse_input
+exec(compile(code, '<string>', 'exec'), {'__builtins__': safe_builtins, '__name__': '__main__'})
+"""
+
+
 @dataclass
 class ExecutionConfig:
     """Configuration for code execution"""
@@ -67,28 +101,10 @@ class CodeExecutionService:
     
     def _setup_execution_environment(self) -> None:
         """Setup the execution environment with safe builtins"""
-        # Create a restricted globals environment
-        safe_builtins = {
-            # Basic types and functions
-            'abs', 'all', 'any', 'bin', 'bool', 'chr', 'dict', 'dir',
-            'divmod', 'enumerate', 'filter', 'float', 'format', 'frozenset',
-            'getattr', 'hasattr', 'hash', 'hex', 'id', 'int', 'isinstance',
-            'issubclass', 'iter', 'len', 'list', 'map', 'max', 'min',
-            'next', 'oct', 'ord', 'pow', 'print', 'range', 'repr',
-            'reversed', 'round', 'set', 'setattr', 'slice', 'sorted',
-            'str', 'sum', 'tuple', 'type', 'zip',
-            # Math operations
-            'divmod', 'pow', 'round',
-            # String operations
-            'chr', 'ord', 'str',
-            # Container operations
-            'len', 'list', 'dict', 'set', 'tuple',
-        }
-        
         # Create restricted builtins
         restricted_builtins = {}
         builtins_source = __builtins__ if isinstance(__builtins__, dict) else __builtins__.__dict__
-        for name in safe_builtins:
+        for name in _SAFE_BUILTINS:
             if name in builtins_source:
                 restricted_builtins[name] = builtins_source[name]
         
@@ -378,6 +394,78 @@ class CodeExecutionService:
                 execution_time=execution_time
             )
     
+    async def execute_code_streaming(self, python_code: str) -> AsyncIterator[Tuple[str, bytes]]:
+        """
+        Execute Python code in a subprocess, yielding its output as it arrives
+        
+        The child runs the code with the same restricted builtins as execute_code.
+        
+        Args:
+            python_code: Python code to execute
+            
+        Yields:
+            ("stdout", chunk) or ("stderr", chunk) tuples in arrival order
+            
+        Raises:
+            ExecutionSecurityError: If code contains unsafe operations
+            ExecutionTimeoutError: If execution exceeds the configured timeout
+        """
+        self._validate_code_safety(python_code)
+        
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, '-u', '-c', _STREAMING_BOOTSTRAP, ','.join(sorted(_SAFE_BUILTINS)),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # All three streams were requested as PIPE, so they are always present
+        assert (process.stdin is not None and process.stdout is not None
+                and process.stderr is not None)
+        process.stdin.write(python_code.encode())
+        process.stdin.close()
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        async def read_stream(name: str, stream: asyncio.StreamReader) -> None:
+            try:
+                while True:
+                    chunk = await stream.read(4096)
+                    if not chunk:
+                        break
+                    await chunks.put((name, chunk))
+            finally:
+                await chunks.put(None)  # Marks this stream as finished
+        
+        readers = [
+            asyncio.ensure_future(read_stream('stdout', process.stdout)),
+            asyncio.ensure_future(read_stream('stderr', process.stderr)),
+        ]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.timeout_seconds
+        open_streams = len(readers)
+        
+        try:
+            while open_streams:
+                try:
+                    item = await asyncio.wait_for(chunks.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    raise ExecutionTimeoutError(
+                        f"Code execution exceeded {self.config.timeout_seconds} seconds"
+                    )
+                
+                if item is None:
+                    open_streams -= 1
+                else:
+                    yield item
+            
+            await process.wait()
+        
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            for reader in readers:
+                reader.cancel()
+    
     def is_code_safe(self, python_code: str) -> tuple[bool, str]:
         """
         Check if code is safe to execute without actually executing it
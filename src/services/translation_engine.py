@@ -268,6 +268,13 @@ class TranslationEngine:
                 time.time() - start_time
             )
     
+    def translate_batch(self, english_sentences: List[str]) -> List[TranslationResult]:
+        """
+        Translate a list of English sentences, returning one result per input in order
+        """
+        translate = self.translate
+        return [translate(sentence) for sentence in english_sentences]
+
     def validate_input(self, sentence: str) -> Tuple[bool, str]:
         """
         Validate input sentence for translation requirements
@@ -5,8 +5,9 @@ Property-based tests for Code Execution Service functionality
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st, assume
 import ast
+import asyncio
 import time
 from src.services import CodeExecutionService, ExecutionConfig
 from src.models.translation_result import ExecutionResult
@@ -322,6 +323,24 @@ class TestCodeExecutionFunctionality:
             assert output1 == output2, \
                 f"Execution should be consistent for code: {code}"
 
+    @given(code=valid_python_code())
+    @settings(max_examples=10, deadline=None)
+    def test_streaming_execution_matches_sandbox(self, code):
+        """
+        Property: Streamed stdout should equal the stdout of the in-process sandbox
+        """
+        service = CodeExecutionService()
+
+        async def collect():
+            return [chunk async for chunk in service.execute_code_streaming(code)]
+
+        chunks = asyncio.run(collect())
+        streamed_stdout = b"".join(data for name, data in chunks if name == "stdout")
+
+        result = service.execute_code(code)
+        assert streamed_stdout.decode() == result.stdout, \
+            f"Streamed output should match sandboxed output for code: {code}"
+
 
 class TestRuntimeErrorHandling:
     """
@@ -250,7 +250,25 @@ class TestTranslationProducesPythonCode:
             # Error messages should be consistent too
             assert result1.error_message == result2.error_message, \
                 f"Translation consistency failed for '{instruction}': error message mismatch"
-    
+
+    @given(instructions=st.lists(valid_english_instructions(), min_size=1, max_size=5))
+    def test_translate_batch_matches_translate(self, instructions):
+        """
+        Property: Batch translation should produce one result per input, in order,
+        matching individual translation
+        """
+        engine = TranslationEngine()
+
+        results = engine.translate_batch(instructions)
+
+        assert len(results) == len(instructions)
+        for instruction, result in zip(instructions, results):
+            expected = engine.translate(instruction)
+            assert result.success == expected.success
+            assert result.python_code == expected.python_code
+            assert result.error_message == expected.error_message
+            assert result.original_text == instruction
+
     @given(instruction=valid_english_instructions())
     def test_generated_code_syntax_validity(self, instruction):
         """
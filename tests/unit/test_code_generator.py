@@ -3,7 +3,152 @@ Unit tests for Code Generator component
 """
 
 import pytest
-import ast
-from src.core.code_generator import CodeGenerator
+from src.core.code_generator import CodeGenerator, _CONDITION_REPLACEMENTS, _TEMPLATE_FNS
 from src.models.parsed_sentence import ParsedSentence, Operation, Condition, PatternType
-from src.models.translation_result import TranslationResult
\ No newline at end of file
+
+
+class TestCodeGenerator:
+    """Test cases for CodeGenerator class"""
+    
+    def test_templates_derived_from_functions(self):
+        """Test TEMPLATES is the str.format view of the template functions"""
+        templates = CodeGenerator.TEMPLATES
+        assert templates.keys() == _TEMPLATE_FNS.keys()
+        assert templates['arithmetic_add'] == '{result} = {operand1} + {operand2}'
+        assert templates['dict_create'] == '{variable} = {{{items}}}'
+        assert templates['string_create'].format(variable='s', value='hi') == \
+            _TEMPLATE_FNS['string_create']('s', 'hi')
+        
+        with pytest.raises(TypeError):
+            CodeGenerator.TEMPLATES['assignment'] = '{variable} := {value}'
+    
+    def test_validate_syntax(self):
+        """Test syntax validation, including repeated (cached) snippets"""
+        generator = CodeGenerator()
+        
+        assert generator.validate_syntax("result = 5 + 3") == (True, "")
+        assert generator.validate_syntax("result = 5 + 3") == (True, "")
+        assert generator.validate_syntax("") == (False, "Empty code")
+        
+        is_valid, error_msg = generator.validate_syntax("if x\n    y = 1")
+        assert not is_valid
+        assert error_msg.startswith("Line 1:")
+        
+        is_valid, error_msg = generator.validate_syntax("if x > 5:\n    return x")
+        assert not is_valid
+        assert error_msg == "Line 2: 'return' outside function"
+    
+    def test_format_condition(self):
+        """Test English comparison phrases become Python operators"""
+        generator = CodeGenerator()
+        
+        assert generator._format_condition("x is equal to 5") == "x == 5"
+        assert generator._format_condition(" a equals b and c greater than d ") == "a == b and c > d"
+        assert generator._format_condition("a less than b or c greater than d") == "a < b or c > d"
+        assert generator._format_condition("this is island") == "this == island"
+    
+    def test_condition_phrase_order(self):
+        """Test longer phrases precede the shorter phrases they start with"""
+        phrases = list(_CONDITION_REPLACEMENTS)
+        for i, phrase in enumerate(phrases):
+            for longer in phrases[i + 1:]:
+                assert not longer.startswith(phrase + ' '), f"{longer!r} must come before {phrase!r}"
+    
+    def test_format_code(self):
+        """Test clean code is returned as-is and messy code is normalized"""
+        generator = CodeGenerator()
+        
+        clean = "if x > 5:\n    print(x)\nelse:\n    pass"
+        assert generator.format_code(clean) is clean
+        assert generator.format_code("  x = 1 \n\ny = 2\n") == "x = 1\ny = 2"
+        assert generator.format_code("for i in items:\n\tprint(i)\n") == "for i in items:\n\tprint(i)"
+    
+    def test_division_by_zero_warning(self):
+        """Test zero divisors are flagged and non-zero or symbolic ones are not"""
+        generator = CodeGenerator()
+        
+        for divisor, expect_warning in [("0", True), ("0.00", True), ("0e3", True), ("0_0", True),
+                                        (0, True), (0.0, True), (2, False), (2.0, False),
+                                        ("2", False), ("0.5", False), ("y", False)]:
+            parsed = ParsedSentence(
+                original_text=f"divide x by {divisor}",
+                pattern_type=PatternType.ARITHMETIC,
+                operations=[Operation('divide', ['x', divisor])]
+            )
+            result = generator.generate(parsed)
+            assert result.success
+            assert result.has_warnings() == expect_warning
+    
+    def test_every_pattern_type_has_generator(self):
+        """Test each known pattern type dispatches to an existing generate_* method"""
+        for pattern_type in PatternType:
+            if pattern_type == PatternType.UNKNOWN:
+                assert pattern_type not in CodeGenerator._GENERATORS
+                continue
+            assert callable(getattr(CodeGenerator, CodeGenerator._GENERATORS[pattern_type]))
+    
+    def test_generate_many(self):
+        """Test batch generation returns one result per sentence with its own warnings"""
+        generator = CodeGenerator()
+        parsed_sentences = [
+            ParsedSentence(
+                original_text="divide x by 0",
+                pattern_type=PatternType.ARITHMETIC,
+                operations=[Operation('divide', ['x', '0'])]
+            ),
+            ParsedSentence(
+                original_text="set name to Alice",
+                pattern_type=PatternType.ASSIGNMENT,
+                variables={'name': 'Alice'}
+            ),
+        ]
+        
+        results = generator.generate_many(parsed_sentences)
+        
+        assert [r.python_code for r in results] == ['result = x / 0', 'name = "Alice"']
+        assert results[0].has_warnings()
+        assert not results[1].has_warnings()
+    
+    def test_generate_assignment(self):
+        """Test single and multiple variable assignments"""
+        generator = CodeGenerator()
+        
+        single = ParsedSentence(original_text="set x to 5", pattern_type=PatternType.ASSIGNMENT,
+                                variables={'x': 5})
+        assert generator.generate_assignment(single) == "x = 5"
+        
+        mixed = ParsedSentence(original_text="set name to Bob and y to x",
+                               pattern_type=PatternType.ASSIGNMENT,
+                               variables={'name': 'Bob'},
+                               operations=[Operation('assign', ['x'], 'y')])
+        assert generator.generate_assignment(mixed) == 'name = "Bob"\ny = x'
+        
+        class Name(str):
+            pass
+        
+        subclass = ParsedSentence(original_text="set x to hi", pattern_type=PatternType.ASSIGNMENT,
+                                  variables={'x': Name('hi')})
+        assert generator.generate_assignment(subclass) == 'x = "hi"'
+    
+    def test_generate_conditional_blocks(self):
+        """Test conditionals with valid, invalid and loop-only blocks"""
+        generator = CodeGenerator()
+        
+        def conditional(then_block, pattern_type=PatternType.CONDITIONAL, **metadata):
+            return ParsedSentence(
+                original_text="if x is 5 then do something",
+                pattern_type=pattern_type,
+                conditions=[Condition('x is 5', 'if')],
+                metadata={'then_block': then_block, 'body': then_block, **metadata}
+            )
+        
+        result = generator.generate(conditional('print(x)', else_block='print(0)'))
+        assert result.success
+        assert result.python_code == "if x == 5:\n    print(x)\nelse:\n    print(0)"
+        
+        assert not generator.generate(conditional('print(x')).success
+        assert not generator.generate(conditional('break')).success
+        
+        result = generator.generate(conditional('break', PatternType.LOOP, loop_type='while'))
+        assert result.success
+        assert result.python_code == "while x == 5:\n    break"
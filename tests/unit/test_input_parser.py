@@ -65,7 +65,21 @@ class TestPatternMatcher:
         # No match
         result = matcher.match_conditional("add x and y")
         assert result is None
-    
+
+    def test_conditional_pattern_priority(self):
+        """Test conditional patterns keep their list order and capture groups"""
+        matcher = PatternMatcher()
+
+        result = matcher.match_conditional("if x > 5 then print big else print small")
+        assert result == ("conditional", ["x > 5", "print big", "print small"])
+
+        result = matcher.match_conditional("if x > 5 then print big")
+        assert result == ("conditional", ["x > 5", "print big"])
+
+        # The if-pattern wins even when a when-pattern appears earlier in the text
+        result = matcher.match_conditional("when a then b if c then d")
+        assert result == ("conditional", ["c", "d"])
+
     def test_loop_patterns(self):
         """Test loop pattern matching"""
         matcher = PatternMatcher()
@@ -161,6 +175,17 @@ class TestInputParser:
         assert parser.identify_pattern("create list with items") == PatternType.DATA_OPERATION
         assert parser.identify_pattern("add item to list") == PatternType.DATA_OPERATION
     
+    def test_identify_pattern_symbol_triggers(self):
+        """Test symbol-only and mixed-case sentences pass the keyword prefilter"""
+        parser = InputParser()
+        
+        assert parser.identify_pattern("a / b") == PatternType.ARITHMETIC
+        assert parser.identify_pattern("a+b") == PatternType.ARITHMETIC
+        assert parser.identify_pattern("a - b") == PatternType.ARITHMETIC
+        assert parser.identify_pattern("a * b") == PatternType.ARITHMETIC
+        assert parser.identify_pattern("x = 5") == PatternType.ASSIGNMENT
+        assert parser.identify_pattern("WHILE x < 10 do x") == PatternType.LOOP
+    
     def test_identify_pattern_unknown(self):
         """Test unknown pattern identification"""
         parser = InputParser()
@@ -283,11 +308,29 @@ class TestInputParser:
         assert valid is False
         assert "long" in message.lower()
         
-        # Dangerous content
-        valid, message = parser.validate_input("import os")
-        assert valid is False
-        assert "unsafe" in message.lower()
+        # Dangerous content, one sentence per alternative of the combined regex
+        for sentence in ["import os", "please EXEC this", "eval the value",
+                         "print __name__ now", "open ('file.txt')"]:
+            valid, message = parser.validate_input(sentence)
+            assert valid is False
+            assert "unsafe" in message.lower()
+        
+        # Words that merely contain a dangerous keyword are fine
+        assert parser.validate_input("set evaluation to 5")[0] is True
     
+    def test_parse_many(self):
+        """Test batch parsing keeps input order and matches parse_sentence"""
+        parser = InputParser()
+        sentences = ["add x and y", "set x to 5", "if x > 5 then print hello"]
+
+        parsed = parser.parse_many(sentences)
+
+        assert [p.original_text for p in parsed] == sentences
+        assert [p.pattern_type for p in parsed] == [
+            parser.parse_sentence(sentence).pattern_type for sentence in sentences
+        ]
+        assert parser.parse_many([]) == []
+
     def test_parse_sentence_empty_input(self):
         """Test parsing empty input raises error"""
         parser = InputParser()
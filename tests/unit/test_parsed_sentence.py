@@ -137,6 +137,32 @@ class TestParsedSentence:
         # Invalid condition type should raise error
         with pytest.raises(TypeError, match="Expected Condition instance"):
             sentence.add_condition("not a condition")
+
+    def test_bulk_add_methods(self):
+        """Test adding variables, operations and conditions in bulk"""
+        sentence = ParsedSentence(original_text="test sentence")
+        operations = [Operation(operation_type="add", operands=["x", "y"]),
+                      Operation(operation_type="assign", operands=["5"], result_variable="z")]
+        condition = Condition(condition_text="x > 5", condition_type="if")
+
+        sentence.add_variables({"x": 5, "y": None})
+        sentence.add_operations(iter(operations))
+        sentence.add_conditions([condition])
+
+        assert sentence.variables == {"x": 5, "y": None}
+        assert sentence.operations == operations
+        assert sentence.conditions == [condition]
+
+        # Invalid entries are rejected before anything is added
+        with pytest.raises(ValueError, match="Variable name cannot be empty"):
+            sentence.add_variables({"w": 1, " ": 2})
+        with pytest.raises(TypeError, match="Expected Operation instance"):
+            sentence.add_operations([operations[0], "not an operation"])
+        with pytest.raises(TypeError, match="Expected Condition instance"):
+            sentence.add_conditions(["not a condition"])
+        assert "w" not in sentence.variables
+        assert len(sentence.operations) == 2
+        assert len(sentence.conditions) == 1
     
     def test_validity_check(self):
         """Test parsed sentence validity checking"""
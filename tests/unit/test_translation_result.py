@@ -210,7 +210,18 @@ class TestTranslationResult:
         assert "x = 1" in lines
         assert "y = 2" in lines
         assert "" not in lines  # Empty lines should be removed
-    
+
+    def test_python_code_lines(self):
+        """Test cached line split of the generated code"""
+        result = TranslationResult(success=True, python_code="x = 1\nprint(x)")
+
+        assert result.python_code_lines == ("x = 1", "print(x)")
+        assert result.python_code_lines is result.python_code_lines
+
+        # Reassigning python_code invalidates the cached split
+        result.python_code = "y = 2"
+        assert result.python_code_lines == ("y = 2",)
+
     def test_get_summary(self):
         """Test summary generation"""
         # Successful translation